@@ -1,1020 +1,2662 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-import re
-import random
-import math
-from datetime import datetime
-import json
-import os
-
-class RwandanP2MathTutor:
-    def __init__(self):
-        self.root = tk.Tk()
-        self.root.title("Rwandan P2 Math Tutor - Primary Education")
-        self.root.geometry("1000x750")
-        self.root.configure(bg='#e8f5e8')  # Rwanda green theme
-
-        # Student progress tracking
-        self.student_data = {
-            'problems_solved': 0,
-            'correct_answers': 0,
-            'topics_practiced': set(),
-            'difficulty_level': 'Easy'
-        }
-
-        # Load existing progress if available
-        self.load_progress()
-
-        self.setup_ui()
-
-    def setup_ui(self):
-        # Main title with Rwanda theme
-        title_frame = tk.Frame(self.root, bg='#e8f5e8')
-        title_frame.pack(pady=10)
-
-        title_label = tk.Label(title_frame, text="🇷🇼 Rwandan P2 Math Tutor",
-                              font=('Arial', 24, 'bold'),
-                              bg='#e8f5e8', fg='#0f5132')
-        title_label.pack()
-
-        subtitle_label = tk.Label(title_frame, text="Primary Two Mathematics - Republic of Rwanda Curriculum",
-                                 font=('Arial', 12),
-                                 bg='#e8f5e8', fg='#198754')
-        subtitle_label.pack()
-
-        # Student info frame
-        info_frame = tk.Frame(self.root, bg='#d1e7dd', relief='ridge', bd=2)
-        info_frame.pack(fill='x', padx=20, pady=5)
-
-        tk.Label(info_frame, text=f"Problems Solved: {self.student_data['problems_solved']} | "
-                                f"Accuracy: {self.get_accuracy():.1f}% | "
-                                f"Level: {self.student_data['difficulty_level']}",
-                font=('Arial', 10), bg='#d1e7dd').pack(pady=5)
-
-        # Problem type selection - P2 Curriculum Topics
-        selection_frame = tk.Frame(self.root, bg='#e8f5e8')
-        selection_frame.pack(pady=10)
-
-        tk.Label(selection_frame, text="Choose P2 Mathematics Topic:",
-                font=('Arial', 14, 'bold'), bg='#e8f5e8', fg='#0f5132').grid(row=0, column=0, columnspan=3, pady=5)
-
-        # P2 Curriculum problem types
-        problem_types = [
-            ("Numbers 0-999", self.numeration_problem),
-            ("Comparing Numbers", self.comparison_problem),
-            ("Addition (up to 999)", self.addition_problem),
-            ("Subtraction (up to 999)", self.subtraction_problem),
-            ("Multiplication", self.multiplication_problem),
-            ("Division", self.division_problem),
-            ("Measuring Lengths", self.length_measurement_problem),
-            ("Measuring Capacity", self.capacity_measurement_problem),
-            ("Measuring Mass", self.mass_measurement_problem),
-            ("Unit Conversion", self.unit_conversion_problem),
-            ("Geometric Shapes", self.geometry_problem),
-            ("Perimeter", self.perimeter_problem),
-            ("Probability", self.probability_problem),
-            ("Word Problems", self.word_problem)
-        ]
-
-        for i, (text, command) in enumerate(problem_types):
-            btn = tk.Button(selection_frame, text=text, command=command,
-                           bg='#198754', fg='white', font=('Arial', 9, 'bold'),
-                           width=15, height=2)
-            btn.grid(row=1 + i//3, column=i%3, padx=3, pady=3)
-
-        # Difficulty selection
-        difficulty_frame = tk.Frame(self.root, bg='#e8f5e8')
-        difficulty_frame.pack(pady=5)
-
-        tk.Label(difficulty_frame, text="Difficulty:",
-                font=('Arial', 12, 'bold'), bg='#e8f5e8').pack(side='left')
-
-        self.difficulty_var = tk.StringVar(value=self.student_data['difficulty_level'])
-        difficulty_combo = ttk.Combobox(difficulty_frame, textvariable=self.difficulty_var,
-                                       values=['Easy', 'Medium', 'Hard'], state='readonly')
-        difficulty_combo.pack(side='left', padx=10)
-        difficulty_combo.bind('<<ComboboxSelected>>', self.update_difficulty)
-
-        # Problem display area
-        self.problem_frame = tk.Frame(self.root, bg='white', relief='ridge', bd=2)
-        self.problem_frame.pack(fill='both', expand=True, padx=20, pady=10)
-
-        # Chat/Tutorial area
-        self.chat_area = scrolledtext.ScrolledText(self.problem_frame,
-                                                  height=15, width=90,
-                                                  font=('Arial', 11),
-                                                  bg='#f8f9fa', fg='#212529')
-        self.chat_area.pack(fill='both', expand=True, padx=10, pady=10)
-
-        # Input area
-        input_frame = tk.Frame(self.problem_frame, bg='white')
-        input_frame.pack(fill='x', padx=10, pady=5)
-
-        tk.Label(input_frame, text="Your Answer:",
-                font=('Arial', 12, 'bold'), bg='white').pack(side='left')
-
-        self.answer_entry = tk.Entry(input_frame, font=('Arial', 12), width=15)
-        self.answer_entry.pack(side='left', padx=10)
-        self.answer_entry.bind('<Return>', self.check_answer)
-
-        check_btn = tk.Button(input_frame, text="Check Answer",
-                             command=self.check_answer,
-                             bg='#198754', fg='white', font=('Arial', 10, 'bold'))
-        check_btn.pack(side='left', padx=5)
-
-        hint_btn = tk.Button(input_frame, text="Get Hint",
-                            command=self.get_hint,
-                            bg='#fd7e14', fg='white', font=('Arial', 10, 'bold'))
-        hint_btn.pack(side='left', padx=5)
-
-        # Current problem storage
-        self.current_problem = None
-        self.current_answer = None
-        self.current_steps = []
-        self.hint_count = 0
-
-        # Welcome message
-        self.add_message("🇷🇼 Muraho! Welcome to Rwandan P2 Math Tutor! Choose a topic to practice mathematics.", "tutor")
-
-    def add_message(self, message, sender="tutor"):
-        timestamp = datetime.now().strftime("%H:%M")
-
-        if sender == "tutor":
-            prefix = f"[{timestamp}] 🧑‍🏫 Mwarimu: "
-            self.chat_area.insert(tk.END, prefix, "tutor_prefix")
-            self.chat_area.insert(tk.END, message + "\n\n", "tutor_message")
-        else:
-            prefix = f"[{timestamp}] 👨‍🎓 Umunyeshuri: "
-            self.chat_area.insert(tk.END, prefix, "student_prefix")
-            self.chat_area.insert(tk.END, message + "\n\n", "student_message")
-
-        # Configure text tags with Rwanda theme
-        self.chat_area.tag_configure("tutor_prefix", foreground="#0f5132", font=('Arial', 11, 'bold'))
-        self.chat_area.tag_configure("tutor_message", foreground="#212529")
-        self.chat_area.tag_configure("student_prefix", foreground="#198754", font=('Arial', 11, 'bold'))
-        self.chat_area.tag_configure("student_message", foreground="#212529")
-
-        self.chat_area.see(tk.END)
-
-    def update_difficulty(self, event=None):
-        self.student_data['difficulty_level'] = self.difficulty_var.get()
-        self.save_progress()
-
-    def get_p2_number_range(self):
-        """Get number ranges appropriate for P2 curriculum (0-999)"""
-        if self.student_data['difficulty_level'] == 'Easy':
-            return (1, 50)
-        elif self.student_data['difficulty_level'] == 'Medium':
-            return (10, 200)
-        else:  # Hard
-            return (50, 999)
-
-    def numeration_problem(self):
-        """Numbers 0-999: counting, reading, writing"""
-        problem_types = ['write_number', 'read_number', 'count_sequence', 'place_value']
-        problem_type = random.choice(problem_types)
-
-        if problem_type == 'write_number':
-            num = random.randint(1, 999)
-            number_words = self.number_to_words(num)
-            self.current_problem = f"Write this number in digits: {number_words}"
-            self.current_answer = str(num)
-            self.current_steps = [
-                f"We need to write '{number_words}' in digits",
-                f"Let's break down the number word by word",
-                f"The answer is: {num}"
-            ]
-        elif problem_type == 'read_number':
-            num = random.randint(1, 999)
-            self.current_problem = f"Write this number in words: {num}"
-            self.current_answer = self.number_to_words(num).lower()
-            self.current_steps = [
-                f"We need to write {num} in words",
-                f"Let's break it down by place value",
-                f"The answer is: {self.number_to_words(num)}"
-            ]
-        elif problem_type == 'count_sequence':
-            start = random.randint(1, 980)
-            self.current_problem = f"Continue this counting pattern: {start}, {start+1}, {start+2}, ?, {start+4}"
-            self.current_answer = str(start + 3)
-            self.current_steps = [
-                f"Look at the pattern: {start}, {start+1}, {start+2}, ?, {start+4}",
-                f"Each number increases by 1",
-                f"The missing number is: {start + 3}"
-            ]
-        else:  # place_value
-            num = random.randint(100, 999)
-            place = random.choice(['hundreds', 'tens', 'ones'])
-            if place == 'hundreds':
-                answer = num // 100
-            elif place == 'tens':
-                answer = (num // 10) % 10
-            else:
-                answer = num % 10
-
-            self.current_problem = f"What digit is in the {place} place in the number {num}?"
-            self.current_answer = str(answer)
-            self.current_steps = [
-                f"In the number {num}:",
-                f"Hundreds place: {num // 100}",
-                f"Tens place: {(num // 10) % 10}",
-                f"Ones place: {num % 10}",
-                f"The digit in the {place} place is: {answer}"
-            ]
-
-        self.student_data['topics_practiced'].add('Numeration 0-999')
-        self.hint_count = 0
-        self.add_message(f"📊 Numeration Problem (0-999):\n{self.current_problem}", "tutor")
-        self.answer_entry.focus()
-
-    def comparison_problem(self):
-        """Comparing numbers less than 1000"""
-        min_val, max_val = self.get_p2_number_range()
-        a = random.randint(min_val, max_val)
-        b = random.randint(min_val, max_val)
-
-        # Ensure they're different
-        while a == b:
-            b = random.randint(min_val, max_val)
-
-        comparison_type = random.choice(['greater', 'less', 'equal', 'symbol'])
-
-        if comparison_type == 'greater':
-            self.current_problem = f"Which number is greater: {a} or {b}?"
-            self.current_answer = str(max(a, b))
-        elif comparison_type == 'less':
-            self.current_problem = f"Which number is less: {a} or {b}?"
-            self.current_answer = str(min(a, b))
-        else:  # symbol
-            self.current_problem = f"Compare these numbers using >, < or =: {a} __ {b}"
-            if a > b:
-                self.current_answer = ">"
-            elif a < b:
-                self.current_answer = "<"
-            else:
-                self.current_answer = "="
-
-        self.current_steps = [
-            f"We need to compare {a} and {b}",
-            f"Let's look at the place values",
-            f"Comparing digit by digit from left to right",
-            f"Result: {a} {'>' if a > b else '<' if a < b else '='} {b}"
-        ]
-
-        self.student_data['topics_practiced'].add('Comparing Numbers')
-        self.hint_count = 0
-        self.add_message(f"⚖️ Number Comparison Problem:\n{self.current_problem}", "tutor")
-        self.answer_entry.focus()
-
-    def addition_problem(self):
-        """Addition up to 999"""
-        min_val, max_val = self.get_p2_number_range()
-        a = random.randint(min_val, max_val)
-        b = random.randint(min_val, min(max_val, 999 - a))  # Ensure sum ≤ 999
-
-        self.current_problem = f"{a} + {b}"
-        self.current_answer = a + b
-        self.current_steps = [
-            f"We need to add {a} + {b}",
-            f"Let's use column addition:",
-            f"Start with the ones place: {a%10} + {b%10}",
-            f"Then the tens place: {(a//10)%10} + {(b//10)%10}",
-            f"Finally hundreds place if needed",
-            f"Result: {a} + {b} = {a + b}"
-        ]
-
-        self.student_data['topics_practiced'].add('Addition up to 999')
-        self.hint_count = 0
-        self.add_message(f"➕ Addition Problem (up to 999):\n{self.current_problem} = ?", "tutor")
-        self.answer_entry.focus()
-
-    def subtraction_problem(self):
-        """Subtraction up to 999"""
-        min_val, max_val = self.get_p2_number_range()
-        a = random.randint(min_val, max_val)
-        b = random.randint(min_val, a)  # Ensure positive result
-
-        self.current_problem = f"{a} - {b}"
-        self.current_answer = a - b
-        self.current_steps = [
-            f"We need to subtract {b} from {a}",
-            f"Let's use column subtraction:",
-            f"Start with the ones place: {a%10} - {b%10}",
-            f"Then the tens place: {(a//10)%10} - {(b//10)%10}",
-            f"Check if we need to borrow",
-            f"Result: {a} - {b} = {a - b}"
-        ]
-
-        self.student_data['topics_practiced'].add('Subtraction up to 999')
-        self.hint_count = 0
-        self.add_message(f"➖ Subtraction Problem (up to 999):\n{self.current_problem} = ?", "tutor")
-        self.answer_entry.focus()
-
-    def multiplication_problem(self):
-        """Multiplication for P2 level"""
-        if self.student_data['difficulty_level'] == 'Easy':
-            a = random.randint(1, 5)
-            b = random.randint(1, 10)
-        elif self.student_data['difficulty_level'] == 'Medium':
-            a = random.randint(2, 10)
-            b = random.randint(2, 12)
-        else:  # Hard
-            a = random.randint(5, 15)
-            b = random.randint(2, 20)
-
-        self.current_problem = f"{a} × {b}"
-        self.current_answer = a * b
-        self.current_steps = [
-            f"We need to multiply {a} × {b}",
-            f"This means adding {a} exactly {b} times",
-            f"Or we can use the multiplication table",
-            f"{a} × {b} = {a * b}"
-        ]
-
-        self.student_data['topics_practiced'].add('Multiplication')
-        self.hint_count = 0
-        self.add_message(f"✖️ Multiplication Problem:\n{self.current_problem} = ?", "tutor")
-        self.answer_entry.focus()
-
-    def division_problem(self):
-        """Division for P2 level"""
-        if self.student_data['difficulty_level'] == 'Easy':
-            divisor = random.randint(2, 5)
-            quotient = random.randint(1, 10)
-        elif self.student_data['difficulty_level'] == 'Medium':
-            divisor = random.randint(2, 10)
-            quotient = random.randint(2, 15)
-        else:  # Hard
-            divisor = random.randint(3, 12)
-            quotient = random.randint(3, 20)
-
-        dividend = divisor * quotient  # Ensure clean division
-
-        self.current_problem = f"{dividend} ÷ {divisor}"
-        self.current_answer = quotient
-        self.current_steps = [
-            f"We need to divide {dividend} by {divisor}",
-            f"How many times does {divisor} go into {dividend}?",
-            f"We can think: {divisor} × ? = {dividend}",
-            f"Since {divisor} × {quotient} = {dividend}",
-            f"Result: {dividend} ÷ {divisor} = {quotient}"
-        ]
-
-        self.student_data['topics_practiced'].add('Division')
-        self.hint_count = 0
-        self.add_message(f"➗ Division Problem:\n{self.current_problem} = ?", "tutor")
-        self.answer_entry.focus()
-
-    def length_measurement_problem(self):
-        """Measuring lengths - metric system"""
-        measurement_types = ['measuring', 'estimation', 'comparison']
-        problem_type = random.choice(measurement_types)
-
-        if problem_type == 'measuring':
-            objects = ['pencil', 'book', 'desk', 'classroom', 'playground']
-            obj = random.choice(objects)
-            if obj in ['pencil']:
-                unit = 'cm'
-                value = random.randint(10, 25)
-            elif obj in ['book', 'desk']:
-                unit = 'cm'
-                value = random.randint(20, 100)
-            else:
-                unit = 'm'
-                value = random.randint(3, 50)
-
-            self.current_problem = f"What is the most appropriate unit to measure a {obj}? (cm, m, or km)"
-            self.current_answer = unit
-            self.current_steps = [
-                f"We need to choose the best unit for measuring a {obj}",
-                f"Centimeters (cm) for small objects",
-                f"Meters (m) for medium objects",
-                f"Kilometers (km) for long distances",
-                f"Best unit for {obj}: {unit}"
-            ]
-        else:
-            length1 = random.randint(10, 100)
-            length2 = random.randint(10, 100)
-            self.current_problem = f"Which is longer: {length1} cm or {length2} cm?"
-            self.current_answer = f"{max(length1, length2)} cm"
-            self.current_steps = [
-                f"Compare {length1} cm and {length2} cm",
-                f"The larger number represents the longer length",
-                f"Answer: {max(length1, length2)} cm is longer"
-            ]
-
-        self.student_data['topics_practiced'].add('Length Measurement')
-        self.hint_count = 0
-        self.add_message(f"📏 Length Measurement Problem:\n{self.current_problem}", "tutor")
-        self.answer_entry.focus()
-
-    def capacity_measurement_problem(self):
-        """Measuring capacity - metric system"""
-        containers = ['cup', 'bottle', 'bucket', 'tank', 'spoon']
-        container = random.choice(containers)
-
-        if container in ['spoon']:
-            unit = 'ml'
-            value = random.randint(5, 20)
-        elif container in ['cup', 'bottle']:
-            unit = 'ml'
-            value = random.randint(200, 1000)
-        else:
-            unit = 'l'
-            value = random.randint(5, 50)
-
-        self.current_problem = f"What is the most appropriate unit to measure the capacity of a {container}? (ml or l)"
-        self.current_answer = unit
-        self.current_steps = [
-            f"We need to choose the best unit for measuring a {container}'s capacity",
-            f"Milliliters (ml) for small amounts",
-            f"Liters (l) for larger amounts",
-            f"Best unit for {container}: {unit}"
-        ]
-
-        self.student_data['topics_practiced'].add('Capacity Measurement')
-        self.hint_count = 0
-        self.add_message(f"🥤 Capacity Measurement Problem:\n{self.current_problem}", "tutor")
-        self.answer_entry.focus()
-
-    def mass_measurement_problem(self):
-        """Measuring mass - metric system"""
-        objects = ['coin', 'apple', 'book', 'person', 'car', 'feather']
-        obj = random.choice(objects)
-
-        if obj in ['coin', 'feather']:
-            unit = 'g'
-            value = random.randint(1, 50)
-        elif obj in ['apple', 'book']:
-            unit = 'g'
-            value = random.randint(100, 1000)
-        else:
-            unit = 'kg'
-            value = random.randint(20, 1000)
-
-        self.current_problem = f"What is the most appropriate unit to measure the mass of a {obj}? (g or kg)"
-        self.current_answer = unit
-        self.current_steps = [
-            f"We need to choose the best unit for measuring a {obj}'s mass",
-            f"Grams (g) for light objects",
-            f"Kilograms (kg) for heavy objects",
-            f"Best unit for {obj}: {unit}"
-        ]
-
-        self.student_data['topics_practiced'].add('Mass Measurement')
-        self.hint_count = 0
-        self.add_message(f"⚖️ Mass Measurement Problem:\n{self.current_problem}", "tutor")
-        self.answer_entry.focus()
-
-    def unit_conversion_problem(self):
-        """Converting between units of measurement"""
-        conversion_types = ['length', 'capacity', 'mass']
-        conv_type = random.choice(conversion_types)
-
-        if conv_type == 'length':
-            if random.choice([True, False]):
-                meters = random.randint(1, 10)
-                self.current_problem = f"Convert {meters} meters to centimeters"
-                self.current_answer = str(meters * 100)
-                self.current_steps = [
-                    f"We need to convert {meters} meters to centimeters",
-                    f"1 meter = 100 centimeters",
-                    f"{meters} meters = {meters} × 100 = {meters * 100} centimeters"
-                ]
-            else:
-                cm = random.randint(100, 1000)
-                if cm % 100 == 0:  # Only use values that convert evenly
-                    self.current_problem = f"Convert {cm} centimeters to meters"
-                    self.current_answer = str(cm // 100)
-                    self.current_steps = [
-                        f"We need to convert {cm} centimeters to meters",
-                        f"100 centimeters = 1 meter",
-                        f"{cm} centimeters = {cm} ÷ 100 = {cm // 100} meters"
-                    ]
-                else:
-                    cm = 500  # Use a simple conversion
-                    self.current_problem = f"Convert {cm} centimeters to meters"
-                    self.current_answer = str(cm // 100)
-                    self.current_steps = [
-                        f"We need to convert {cm} centimeters to meters",
-                        f"100 centimeters = 1 meter",
-                        f"{cm} centimeters = {cm} ÷ 100 = {cm // 100} meters"
-                    ]
-
-        elif conv_type == 'capacity':
-            if random.choice([True, False]):
-                liters = random.randint(1, 5)
-                self.current_problem = f"Convert {liters} liters to milliliters"
-                self.current_answer = str(liters * 1000)
-                self.current_steps = [
-                    f"We need to convert {liters} liters to milliliters",
-                    f"1 liter = 1000 milliliters",
-                    f"{liters} liters = {liters} × 1000 = {liters * 1000} milliliters"
-                ]
-            else:
-                ml = random.choice([1000, 2000, 3000, 4000, 5000])
-                self.current_problem = f"Convert {ml} milliliters to liters"
-                self.current_answer = str(ml // 1000)
-                self.current_steps = [
-                    f"We need to convert {ml} milliliters to liters",
-                    f"1000 milliliters = 1 liter",
-                    f"{ml} milliliters = {ml} ÷ 1000 = {ml // 1000} liters"
-                ]
-
-        else:  # mass
-            if random.choice([True, False]):
-                kg = random.randint(1, 5)
-                self.current_problem = f"Convert {kg} kilograms to grams"
-                self.current_answer = str(kg * 1000)
-                self.current_steps = [
-                    f"We need to convert {kg} kilograms to grams",
-                    f"1 kilogram = 1000 grams",
-                    f"{kg} kilograms = {kg} × 1000 = {kg * 1000} grams"
-                ]
-            else:
-                g = random.choice([1000, 2000, 3000, 4000, 5000])
-                self.current_problem = f"Convert {g} grams to kilograms"
-                self.current_answer = str(g // 1000)
-                self.current_steps = [
-                    f"We need to convert {g} grams to kilograms",
-                    f"1000 grams = 1 kilogram",
-                    f"{g} grams = {g} ÷ 1000 = {g // 1000} kilograms"
-                ]
-
-        self.student_data['topics_practiced'].add('Unit Conversion')
-        self.hint_count = 0
-        self.add_message(f"🔄 Unit Conversion Problem:\n{self.current_problem}", "tutor")
-        self.answer_entry.focus()
-
-    def geometry_problem(self):
-        """Identifying and drawing geometric shapes"""
-        shapes = ['square', 'rectangle', 'triangle', 'circle']
-        problem_types = ['identify', 'properties', 'count_sides']
-
-        shape = random.choice(shapes)
-        problem_type = random.choice(problem_types)
-
-        if problem_type == 'identify':
-            descriptions = {
-                'square': 'has 4 equal sides and 4 right angles',
-                'rectangle': 'has 4 sides with opposite sides equal and 4 right angles',
-                'triangle': 'has 3 sides and 3 angles',
-                'circle': 'is round with no corners'
-            }
-            self.current_problem = f"What shape {descriptions[shape]}?"
-            self.current_answer = shape
-
-        elif problem_type == 'properties':
-            if shape == 'square':
-                self.current_problem = f"How many sides does a square have?"
-                self.current_answer = "4"
-            elif shape == 'rectangle':
-                self.current_problem = f"How many right angles does a rectangle have?"
-                self.current_answer = "4"
-            elif shape == 'triangle':
-                self.current_problem = f"How many sides does a triangle have?"
-                self.current_answer = "3"
-            else:  # circle
-                self.current_problem = f"How many corners does a circle have?"
-                self.current_answer = "0"
-
-        else:  # count_sides
-            sides = {'square': 4, 'rectangle': 4, 'triangle': 3, 'circle': 0}
-            self.current_problem = f"How many sides does a {shape} have?"
-            self.current_answer = str(sides[shape])
-
-        self.current_steps = [
-            f"Let's think about the properties of a {shape}",
-            f"A {shape} is a geometric shape with specific characteristics",
-            f"The answer is: {self.current_answer}"
-        ]
-
-        self.student_data['topics_practiced'].add('Geometric Shapes')
-        self.hint_count = 0
-        self.add_message(f"🔺 Geometry Problem:\n{self.current_problem}", "tutor")
-        self.answer_entry.focus()
-
-    def perimeter_problem(self):
-        """Calculating perimeter of geometric figures"""
-        shapes = ['square', 'rectangle', 'triangle']
-        shape = random.choice(shapes)
-
-        if shape == 'square':
-            side = random.randint(3, 15)
-            self.current_problem = f"Find the perimeter of a square with side length {side} cm"
-            self.current_answer = str(4 * side)
-            self.current_steps = [
-                f"A square has 4 equal sides of length {side} cm",
-                f"Perimeter = side + side + side + side",
-                f"Perimeter = 4 × {side} = {4 * side} cm"
-            ]
-
-        elif shape == 'rectangle':
-            length = random.randint(5, 20)
-            width = random.randint(3, length-1)
-            self.current_problem = f"Find the perimeter of a rectangle with length {length} cm and width {width} cm"
-            self.current_answer = str(2 * (length + width))
-            self.current_steps = [
-                f"A rectangle has length {length} cm and width {width} cm",
-                f"Perimeter = length + width + length + width",
-                f"Perimeter = 2 × (length + width)",
-                f"Perimeter = 2 × ({length} + {width}) = 2 × {length + width} = {2 * (length + width)} cm"
-            ]
-
-        else:  # triangle
-            side1 = random.randint(3, 12)
-            side2 = random.randint(3, 12)
-            side3 = random.randint(3, 12)
-            self.current_problem = f"Find the perimeter of a triangle with sides {side1} cm, {side2} cm, and {side3} cm"
-            self.current_answer = str(side1 + side2 + side3)
-            self.current_steps = [
-                f"A triangle has three sides: {side1} cm, {side2} cm, and {side3} cm",
-                f"Perimeter = side1 + side2 + side3",
-                f"Perimeter = {side1} + {side2} + {side3} = {side1 + side2 + side3} cm"
-            ]
-
-        self.student_data['topics_practiced'].add('Perimeter')
-        self.hint_count = 0
-        self.add_message(f"📐 Perimeter Problem:\n{self.current_problem}", "tutor")
-        self.answer_entry.focus()
-
-    def probability_problem(self):
-        """Understanding and applying probability concepts"""
-        problem_types = ['basic_probability', 'certain_impossible', 'likely_unlikely']
-        problem_type = random.choice(problem_types)
-
-        if problem_type == 'basic_probability':
-            colors = ['red', 'blue', 'green', 'yellow']
-            target_color = random.choice(colors)
-            total_balls = random.randint(5, 10)
-            target_balls = random.randint(1, total_balls-1)
-
-            self.current_problem = f"In a bag, there are {target_balls} {target_color} balls and {total_balls - target_balls} other colored balls. What is the chance of picking a {target_color} ball? (likely, unlikely, certain, impossible)"
-
-            if target_balls > total_balls // 2:
-                self.current_answer = "likely"
-            elif target_balls == total_balls:
-                self.current_answer = "certain"
-            elif target_balls == 0:
-                self.current_answer = "impossible"
-            else:
-                self.current_answer = "unlikely"
-
-            self.current_steps = [
-                f"There are {target_balls} {target_color} balls out of {total_balls} total balls",
-                f"If more than half are {target_color}, it's likely",
-                f"If less than half are {target_color}, it's unlikely",
-                f"Answer: {self.current_answer}"
-            ]
-
-        elif problem_type == 'certain_impossible':
-            scenarios = [
-                ("The sun will rise tomorrow", "certain"),
-                ("You will grow wings and fly", "impossible"),
-                ("It will rain sometime this year", "likely"),
-                ("You will meet a dinosaur today", "impossible"),
-                ("You will breathe air today", "certain")
-            ]
-            scenario, answer = random.choice(scenarios)
-            self.current_problem = f"Is this certain, impossible, likely, or unlikely: '{scenario}'?"
-            self.current_answer = answer
-            self.current_steps = [
-                f"Let's think about: {scenario}",
-                f"Certain = will definitely happen",
-                f"Impossible = will never happen",
-                f"Likely = probably will happen",
-                f"Unlikely = probably won't happen",
-                f"Answer: {answer}"
-            ]
-
-        else:  # likely_unlikely
-            activities = [
-                ("It will rain in the desert", "unlikely"),
-                ("A coin will land on heads or tails", "certain"),
-                ("You will eat food today", "likely"),
-                ("You will win the lottery", "unlikely"),
-                ("The sun will set tonight", "certain")
-            ]
-            activity, answer = random.choice(activities)
-            self.current_problem = f"Is this likely, unlikely, certain, or impossible: '{activity}'?"
-            self.current_answer = answer
-            self.current_steps = [
-                f"Let's analyze: {activity}",
-                f"Think about how often this happens",
-                f"Answer: {answer}"
-            ]
-
-        self.student_data['topics_practiced'].add('Probability')
-        self.hint_count = 0
-        self.add_message(f"🎲 Probability Problem:\n{self.current_problem}", "tutor")
-        self.answer_entry.focus()
-
-    def word_problem(self):
-        """Word problems incorporating P2 curriculum topics"""
-        problem_categories = ['shopping', 'measurement', 'school', 'geometry']
-        category = random.choice(problem_categories)
-
-        if category == 'shopping':
-            item1 = random.choice(['apples', 'bananas', 'oranges', 'mangoes'])
-            item2 = random.choice(['notebooks', 'pencils', 'erasers', 'rulers'])
-            price1 = random.randint(100, 800)  # Rwanda Francs
-            price2 = random.randint(50, 500)
-
-            operation = random.choice(['addition', 'subtraction'])
-            if operation == 'addition':
-                self.current_problem = f"Marie bought {item1} for {price1} Rwf and {item2} for {price2} Rwf. How much did she spend in total?"
-                self.current_answer = str(price1 + price2)
-                self.current_steps = [
-                    f"Marie spent {price1} Rwf on {item1}",
-                    f"She spent {price2} Rwf on {item2}",
-                    f"Total = {price1} + {price2} = {price1 + price2} Rwf"
-                ]
-            else:
-                if price1 > price2:
-                    self.current_problem = f"Jean had {price1} Rwf. He bought something for {price2} Rwf. How much money does he have left?"
-                    self.current_answer = str(price1 - price2)
-                    self.current_steps = [
-                        f"Jean started with {price1} Rwf",
-                        f"He spent {price2} Rwf",
-                        f"Money left = {price1} - {price2} = {price1 - price2} Rwf"
-                    ]
-                else:
-                    # Swap to ensure positive result
-                    self.current_problem = f"Jean had {price2} Rwf. He bought something for {price1} Rwf. How much money does he have left?"
-                    self.current_answer = str(price2 - price1)
-                    self.current_steps = [
-                        f"Jean started with {price2} Rwf",
-                        f"He spent {price1} Rwf",
-                        f"Money left = {price2} - {price1} = {price2 - price1} Rwf"
-                    ]
-
-        elif category == 'measurement':
-            measurements = [
-                ('height', 'meters', random.randint(1, 3)),
-                ('length', 'centimeters', random.randint(20, 200)),
-                ('mass', 'kilograms', random.randint(5, 50)),
-                ('capacity', 'liters', random.randint(2, 20))
-            ]
-            measure_type, unit, value1 = random.choice(measurements)
-            value2 = random.randint(1, value1)
-
-            self.current_problem = f"A rope is {value1} {unit} long. If we cut off {value2} {unit}, how long is the remaining rope?"
-            self.current_answer = str(value1 - value2)
-            self.current_steps = [
-                f"Original rope length: {value1} {unit}",
-                f"Length cut off: {value2} {unit}",
-                f"Remaining length = {value1} - {value2} = {value1 - value2} {unit}"
-            ]
-
-        elif category == 'school':
-            students = random.randint(20, 40)
-            groups = random.randint(2, 8)
-            if students % groups == 0:  # Ensure even division
-                self.current_problem = f"There are {students} students in Primary 2. The teacher wants to divide them into {groups} equal groups. How many students will be in each group?"
-                self.current_answer = str(students // groups)
-                self.current_steps = [
-                    f"Total students: {students}",
-                    f"Number of groups: {groups}",
-                    f"Students per group = {students} ÷ {groups} = {students // groups}"
-                ]
-            else:
-                # Adjust to make it work
-                students = groups * random.randint(3, 8)
-                self.current_problem = f"There are {students} students in Primary 2. The teacher wants to divide them into {groups} equal groups. How many students will be in each group?"
-                self.current_answer = str(students // groups)
-                self.current_steps = [
-                    f"Total students: {students}",
-                    f"Number of groups: {groups}",
-                    f"Students per group = {students} ÷ {groups} = {students // groups}"
-                ]
-
-        else:  # geometry
-            shape = random.choice(['square', 'rectangle'])
-            if shape == 'square':
-                side = random.randint(4, 12)
-                self.current_problem = f"A square garden has sides of {side} meters each. What is the perimeter of the garden?"
-                self.current_answer = str(4 * side)
-                self.current_steps = [
-                    f"Square garden with side = {side} meters",
-                    f"Perimeter of square = 4 × side",
-                    f"Perimeter = 4 × {side} = {4 * side} meters"
-                ]
-            else:
-                length = random.randint(8, 20)
-                width = random.randint(4, length-1)
-                self.current_problem = f"A rectangular field is {length} meters long and {width} meters wide. What is the perimeter of the field?"
-                self.current_answer = str(2 * (length + width))
-                self.current_steps = [
-                    f"Rectangular field: length = {length}m, width = {width}m",
-                    f"Perimeter = 2 × (length + width)",
-                    f"Perimeter = 2 × ({length} + {width}) = {2 * (length + width)} meters"
-                ]
-
-        self.student_data['topics_practiced'].add('Word Problems')
-        self.hint_count = 0
-        self.add_message(f"📚 Word Problem:\n{self.current_problem}", "tutor")
-        self.answer_entry.focus()
-
-    def number_to_words(self, num):
-        """Convert number to words (English)"""
-        if num == 0:
-            return "zero"
-
-        ones = ["", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine",
-                "ten", "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen",
-                "seventeen", "eighteen", "nineteen"]
-
-        tens = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
-
-        result = ""
-
-        if num >= 100:
-            result += ones[num // 100] + " hundred"
-            num %= 100
-            if num > 0:
-                result += " "
-
-        if num >= 20:
-            result += tens[num // 10]
-            num %= 10
-            if num > 0:
-                result += "-" + ones[num]
-        elif num > 0:
-            result += ones[num]
-
-        return result
-
-    def get_hint(self):
-        if not self.current_problem:
-            self.add_message("Please select a problem type first!", "tutor")
-            return
-
-        if self.hint_count < len(self.current_steps):
-            hint = self.current_steps[self.hint_count]
-            self.add_message(f"💡 Hint {self.hint_count + 1}: {hint}", "tutor")
-            self.hint_count += 1
-        else:
-            self.add_message("💡 No more hints available! Try to solve it with the steps provided.", "tutor")
-
-    def check_answer(self, event=None):
-        if not self.current_problem:
-            self.add_message("Please select a problem type first!", "tutor")
-            return
-
-        user_answer = self.answer_entry.get().strip()
-        if not user_answer:
-            self.add_message("Please enter your answer!", "tutor")
-            return
-
-        self.add_message(user_answer, "student")
-
-        # Check if answer is correct
-        try:
-            # Handle different answer types
-            if isinstance(self.current_answer, str):
-                # For text answers (like units, shapes, probability)
-                is_correct = user_answer.lower().strip() == self.current_answer.lower().strip()
-            else:
-                # For numeric answers
-                is_correct = float(user_answer) == float(self.current_answer)
-
-            if is_correct:
-                self.student_data['problems_solved'] += 1
-                self.student_data['correct_answers'] += 1
-
-                encouragement = random.choice([
-                    "🎉 Byiza cyane! (Very good!)",
-                    "👏 Ni ukuri! (That's correct!)",
-                    "⭐ Wakoze neza! (Well done!)",
-                    "🌟 Excellent work!",
-                    "🎊 Urakoze! (Thank you!) Perfect answer!"
-                ])
-
-                self.add_message(f"{encouragement} You got it right!\n\nHere's the complete solution:", "tutor")
-
-                # Show complete solution
-                for i, step in enumerate(self.current_steps, 1):
-                    self.add_message(f"Step {i}: {step}", "tutor")
-
-            else:
-                self.student_data['problems_solved'] += 1
-
-                self.add_message(f"Ntabwo ari ukuri (Not quite right). The correct answer is {self.current_answer}.\n\nLet me show you how to solve it:", "tutor")
-
-                # Show complete solution
-                for i, step in enumerate(self.current_steps, 1):
-                    self.add_message(f"Step {i}: {step}", "tutor")
-
-        except ValueError:
-            self.add_message("Please enter a valid answer!", "tutor")
-            return
-
-        # Clear the problem
-        self.current_problem = None
-        self.current_answer = None
-        self.current_steps = []
-        self.answer_entry.delete(0, tk.END)
-
-        # Save progress
-        self.save_progress()
-        self.update_progress_display()
-
-        # Encourage next problem
-        self.add_message("Witeguye indi nkuru? (Ready for another problem?) Choose a topic above! 🚀", "tutor")
-
-    def get_accuracy(self):
-        if self.student_data['problems_solved'] == 0:
-            return 0.0
-        return (self.student_data['correct_answers'] / self.student_data['problems_solved']) * 100
-
-    def update_progress_display(self):
-        # Update the progress display in the info frame
-        for widget in self.root.winfo_children():
-            if isinstance(widget, tk.Frame) and widget.cget('bg') == '#d1e7dd':
-                for child in widget.winfo_children():
-                    if isinstance(child, tk.Label):
-                        child.config(text=f"Problems Solved: {self.student_data['problems_solved']} | "
-                                         f"Accuracy: {self.get_accuracy():.1f}% | "
-                                         f"Level: {self.student_data['difficulty_level']}")
-
-    def save_progress(self):
-        try:
-            # Convert set to list for JSON serialization
-            data_to_save = self.student_data.copy()
-            data_to_save['topics_practiced'] = list(data_to_save['topics_practiced'])
-
-            with open('rwanda_p2_math_progress.json', 'w') as f:
-                json.dump(data_to_save, f)
-        except Exception as e:
-            print(f"Could not save progress: {e}")
-
-    def load_progress(self):
-        try:
-            if os.path.exists('rwanda_p2_math_progress.json'):
-                with open('rwanda_p2_math_progress.json', 'r') as f:
-                    data = json.load(f)
-                    self.student_data.update(data)
-                    # Convert list back to set
-                    self.student_data['topics_practiced'] = set(self.student_data['topics_practiced'])
-        except Exception as e:
-            print(f"Could not load progress: {e}")
-
-    def run(self):
-        self.root.mainloop()
-
-# Additional utility functions for P2 curriculum
-class RwandanP2MathUtils:
-    @staticmethod
-    def is_valid_p2_number(num):
-        """Check if number is within P2 range (0-999)"""
-        return 0 <= num <= 999
-
-    @staticmethod
-    def convert_to_rwandan_francs(amount):
-        """Format amount as Rwandan Francs"""
-        return f"{amount} Rwf"
-
-    @staticmethod
-    def get_shape_properties(shape):
-        """Get properties of geometric shapes for P2 level"""
-        properties = {
-            'square': {'sides': 4, 'angles': 4, 'equal_sides': True},
-            'rectangle': {'sides': 4, 'angles': 4, 'equal_sides': False},
-            'triangle': {'sides': 3, 'angles': 3, 'equal_sides': False},
-            'circle': {'sides': 0, 'angles': 0, 'equal_sides': False}
-        }
-        return properties.get(shape, {})
-
-    @staticmethod
-    def metric_conversion_factor(from_unit, to_unit):
-        """Get conversion factors for metric units"""
-        conversions = {
-            ('m', 'cm'): 100,
-            ('cm', 'm'): 0.01,
-            ('l', 'ml'): 1000,
-            ('ml', 'l'): 0.001,
-            ('kg', 'g'): 1000,
-            ('g', 'kg'): 0.001
-        }
-        return conversions.get((from_unit, to_unit), 1)
-
-# Main execution
-if __name__ == "__main__":
-    print("🇷🇼 Starting Rwandan P2 Math Tutor System...")
-    print("📚 Based on Republic of Rwanda Primary Two Curriculum:")
-    print("   ✅ Numeration and Operations (0-999)")
-    print("   ✅ Number comparison")
-    print("   ✅ Addition and Subtraction (up to 999)")
-    print("   ✅ Multiplication and Division")
-    print("   ✅ Metric Systems (Length, Capacity, Mass)")
-    print("   ✅ Unit Conversions")
-    print("   ✅ Geometric Figures (Squares, Rectangles, Triangles)")
-    print("   ✅ Perimeter Calculations")
-    print("   ✅ Probability Concepts")
-    print("   ✅ Contextual Word Problems")
-    print("\n🎯 Perfectly aligned with Rwandan Primary Education Standards!")
-    print("🌟 Features Kinyarwanda greetings and local context")
-
-    # Create and run the tutor
-    tutor = RwandanP2MathTutor()
-    tutor.run()
+import re
+import random
+import math
+from datetime import datetime
+import json
+import os
+import sys
+import argparse
+import socket
+import socketserver
+import struct
+import threading
+import uuid
+import mmap
+import time
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import zlib
+import itertools
+import bisect
+import html
+import importlib.util
+from array import array
+from collections import OrderedDict, deque
+
+try:
+    import tkinter as tk
+    from tkinter import ttk, messagebox, scrolledtext
+except ImportError:
+    # Only the window needs Tk: HeadlessTutor, --simulate, --verify, --hub,
+    # --build-bank and the sync options work without it
+    tk = None
+
+class RwandanP2MathTutor:
+    PROGRESS_FILE = 'rwanda_p2_math_progress.json'
+    ATTEMPT_LOG_FILE = 'rwanda_p2_math_attempts.jsonl'
+    ANALYTICS_FILE = 'rwanda_p2_class_analytics.json'  # teacher report totals, see --report
+    PREFETCH_DEPTH = 3  # ready problems kept per topic
+    PROFILE_DIR = 'rwanda_p2_profiles'  # one progress file per pupil in kiosk mode
+    PROFILE_CACHE_SIZE = 40  # pupils kept in memory in kiosk mode
+    TRANSCRIPT_LENGTH = 200  # chat messages kept per pupil
+
+    def __init__(self, kiosk=False, class_name=None):
+        self.root = tk.Tk()
+        self.root.title("Rwandan P2 Math Tutor - Primary Education")
+        self.root.geometry("1000x750")
+        self.root.configure(bg='#e8f5e8')  # Rwanda green theme
+
+        self.kiosk = kiosk
+        self.init_state(self.profile_path('Student') if kiosk else self.PROGRESS_FILE,
+                        class_name=class_name)
+        self.setup_ui()
+
+    def init_state(self, progress_file, student_name='Student', rng=None, class_name=None):
+        """Set up everything except the window, shared with HeadlessTutor.
+
+        ``class_name``, when given, puts every pupil loaded on this computer
+        in that class for the teacher's reports.
+        """
+        self.progress_file = progress_file
+        self.class_name = class_name
+
+        # Student progress tracking, with existing progress loaded if available
+        self.student_data = self.new_student_data()
+        self.student_data['student_name'] = student_name
+        self.load_progress()
+
+        # Problem generation, avoiding recently seen problems
+        self.generator = RwandanP2ProblemGenerator(rng)
+        self.distractors = DistractorGenerator(self.generator.rng, self.generator.topics)
+        self.load_student_state()
+        self.transcript = deque(maxlen=self.TRANSCRIPT_LENGTH)
+
+        # Kiosk mode: recently used pupils' state, least recently used first
+        self.profiles = OrderedDict()
+
+        # Problems generated ahead of time during Tk idle time, per topic
+        # used so far, so topics nobody picks are never imported
+        self.prefetched = {}
+        self.prefetch_scheduled = False
+
+        self.clear_current_problem()
+
+    def clear_current_problem(self):
+        self.current_kind = None
+        self.current_difficulty = None
+        self.current_topic = None
+        self.current_problem = None
+        self.current_answer = None
+        self.current_steps = []
+        self.current_choices = []
+        self.hint_count = 0
+
+    def new_student_data(self):
+        return {
+            'problems_solved': 0,
+            'correct_answers': 0,
+            'topics_practiced': set(),
+            'difficulty_level': 'Easy',
+            'recent_problems': [],
+            'problem_coverage': {},
+            'fact_mastery': {},
+            'student_name': 'Student',
+            'class_name': 'P2',
+            'language': 'en',
+            'multiple_choice': False
+        }
+
+    def load_student_state(self):
+        """Build the per-student indexes from the loaded student_data"""
+        self.recent_problems = RecentProblemIndex(keys=self.student_data['recent_problems'])
+        self.coverage = ProblemCoverage(self.student_data['problem_coverage'])
+        self.fact_mastery = FactMastery(self.student_data['fact_mastery'])
+        self.catalog = MessageCatalog.get(self.student_data['language'])
+        self.generator.language = self.student_data['language']
+
+    def setup_ui(self):
+        # Main title with Rwanda theme
+        title_frame = tk.Frame(self.root, bg='#e8f5e8')
+        title_frame.pack(pady=10)
+
+        title_label = tk.Label(title_frame, text="🇷🇼 Rwandan P2 Math Tutor",
+                              font=('Arial', 24, 'bold'),
+                              bg='#e8f5e8', fg='#0f5132')
+        title_label.pack()
+
+        # Widgets whose text comes from the message catalogue, by message key
+        self.catalog_widgets = {}
+
+        subtitle_label = tk.Label(title_frame, text=self.catalog.text('subtitle'),
+                                 font=('Arial', 12),
+                                 bg='#e8f5e8', fg='#198754')
+        subtitle_label.pack()
+        self.catalog_widgets['subtitle'] = subtitle_label
+
+        # Student info frame
+        info_frame = tk.Frame(self.root, bg='#d1e7dd', relief='ridge', bd=2)
+        info_frame.pack(fill='x', padx=20, pady=5)
+
+        tk.Label(info_frame, text=self.progress_text(),
+                font=('Arial', 10), bg='#d1e7dd').pack(pady=5)
+
+        # Problem type selection - P2 Curriculum Topics
+        selection_frame = tk.Frame(self.root, bg='#e8f5e8')
+        selection_frame.pack(pady=10)
+
+        self.catalog_widgets['choose_topic'] = tk.Label(selection_frame, text=self.catalog.text('choose_topic'),
+                font=('Arial', 14, 'bold'), bg='#e8f5e8', fg='#0f5132')
+        self.catalog_widgets['choose_topic'].grid(row=0, column=0, columnspan=3, pady=5)
+
+        # P2 Curriculum topics, plus any topic modules the school has added
+        self.topic_buttons = []
+        for i, topic in enumerate(self.generator.topics):
+            btn = tk.Button(selection_frame, text=self.catalog.topic_label(topic),
+                           command=lambda kind=topic.kind: self.pose_problem(kind),
+                           bg='#198754', fg='white', font=('Arial', 9, 'bold'),
+                           width=15, height=2)
+            btn.grid(row=1 + i//3, column=i%3, padx=3, pady=3)
+            self.topic_buttons.append((topic, btn))
+
+        # Difficulty selection
+        difficulty_frame = tk.Frame(self.root, bg='#e8f5e8')
+        difficulty_frame.pack(pady=5)
+
+        self.catalog_widgets['difficulty'] = tk.Label(difficulty_frame, text=self.catalog.text('difficulty'),
+                font=('Arial', 12, 'bold'), bg='#e8f5e8')
+        self.catalog_widgets['difficulty'].pack(side='left')
+
+        self.difficulty_var = tk.StringVar(value=self.student_data['difficulty_level'])
+        difficulty_combo = ttk.Combobox(difficulty_frame, textvariable=self.difficulty_var,
+                                       values=['Easy', 'Medium', 'Hard'], state='readonly')
+        difficulty_combo.pack(side='left', padx=10)
+        difficulty_combo.bind('<<ComboboxSelected>>', self.update_difficulty)
+
+        self.catalog_widgets['language'] = tk.Label(difficulty_frame, text=self.catalog.text('language'),
+                font=('Arial', 12, 'bold'), bg='#e8f5e8')
+        self.catalog_widgets['language'].pack(side='left', padx=(20, 0))
+
+        self.language_var = tk.StringVar(value=MessageCatalog.LANGUAGES[self.student_data['language']])
+        language_combo = ttk.Combobox(difficulty_frame, textvariable=self.language_var,
+                                     values=list(MessageCatalog.LANGUAGES.values()), state='readonly')
+        language_combo.pack(side='left', padx=10)
+        language_combo.bind('<<ComboboxSelected>>', self.update_language)
+
+        self.multiple_choice_var = tk.BooleanVar(value=self.student_data['multiple_choice'])
+        self.catalog_widgets['multiple_choice'] = tk.Checkbutton(difficulty_frame,
+                      text=self.catalog.text('multiple_choice'), variable=self.multiple_choice_var,
+                      command=self.update_multiple_choice,
+                      font=('Arial', 12, 'bold'), bg='#e8f5e8')
+        self.catalog_widgets['multiple_choice'].pack(side='left', padx=(20, 0))
+
+        # Kiosk mode: pupils pick their own name on a shared computer
+        if self.kiosk:
+            pupil_frame = tk.Frame(self.root, bg='#e8f5e8')
+            pupil_frame.pack(pady=5)
+
+            self.catalog_widgets['pupil'] = tk.Label(pupil_frame, text=self.catalog.text('pupil'),
+                    font=('Arial', 12, 'bold'), bg='#e8f5e8')
+            self.catalog_widgets['pupil'].pack(side='left')
+
+            self.pupil_var = tk.StringVar(value=self.student_data['student_name'])
+            self.pupil_combo = ttk.Combobox(pupil_frame, textvariable=self.pupil_var,
+                                            values=self.profile_names())
+            self.pupil_combo.pack(side='left', padx=10)
+            self.pupil_combo.bind('<Return>', lambda event: self.switch_student(self.pupil_var.get()))
+            self.pupil_combo.bind('<<ComboboxSelected>>', lambda event: self.switch_student(self.pupil_var.get()))
+
+            self.catalog_widgets['switch_pupil'] = tk.Button(pupil_frame, text=self.catalog.text('switch_pupil'),
+                     command=lambda: self.switch_student(self.pupil_var.get()),
+                     bg='#0f5132', fg='white', font=('Arial', 10, 'bold'))
+            self.catalog_widgets['switch_pupil'].pack(side='left', padx=5)
+
+        # Problem display area
+        self.problem_frame = tk.Frame(self.root, bg='white', relief='ridge', bd=2)
+        self.problem_frame.pack(fill='both', expand=True, padx=20, pady=10)
+
+        # Chat/Tutorial area
+        self.chat_area = scrolledtext.ScrolledText(self.problem_frame,
+                                                  height=15, width=90,
+                                                  font=('Arial', 11),
+                                                  bg='#f8f9fa', fg='#212529')
+        self.chat_area.pack(fill='both', expand=True, padx=10, pady=10)
+
+        # Input area
+        input_frame = tk.Frame(self.problem_frame, bg='white')
+        input_frame.pack(fill='x', padx=10, pady=5)
+
+        self.catalog_widgets['your_answer'] = tk.Label(input_frame, text=self.catalog.text('your_answer'),
+                font=('Arial', 12, 'bold'), bg='white')
+        self.catalog_widgets['your_answer'].pack(side='left')
+
+        self.answer_entry = tk.Entry(input_frame, font=('Arial', 12), width=15)
+        self.answer_entry.pack(side='left', padx=10)
+        self.answer_entry.bind('<Return>', self.check_answer)
+
+        check_btn = tk.Button(input_frame, text=self.catalog.text('check_answer'),
+                             command=self.check_answer,
+                             bg='#198754', fg='white', font=('Arial', 10, 'bold'))
+        check_btn.pack(side='left', padx=5)
+        self.catalog_widgets['check_answer'] = check_btn
+
+        hint_btn = tk.Button(input_frame, text=self.catalog.text('get_hint'),
+                            command=self.get_hint,
+                            bg='#fd7e14', fg='white', font=('Arial', 10, 'bold'))
+        hint_btn.pack(side='left', padx=5)
+        self.catalog_widgets['get_hint'] = hint_btn
+
+        # Multiple-choice answers, shown under the input area when enabled
+        self.choice_frame = tk.Frame(self.problem_frame, bg='white')
+        self.choice_buttons = [tk.Button(self.choice_frame, bg='#0f5132', fg='white',
+                                         font=('Arial', 12, 'bold'), width=18)
+                               for _ in range(DistractorGenerator.CHOICES)]
+
+        # Welcome message
+        self.add_message(self.catalog.text('welcome'), "tutor")
+
+        self.schedule_prefetch()
+
+    def add_message(self, message, sender="tutor"):
+        timestamp = datetime.now().strftime("%H:%M")
+        self.transcript.append((timestamp, message, sender))
+        self.show_message(timestamp, message, sender)
+
+    def show_message(self, timestamp, message, sender):
+        if sender == "tutor":
+            prefix = f"[{timestamp}] 🧑‍🏫 Mwarimu: "
+            self.chat_area.insert(tk.END, prefix, "tutor_prefix")
+            self.chat_area.insert(tk.END, message + "\n\n", "tutor_message")
+        else:
+            prefix = f"[{timestamp}] 👨‍🎓 Umunyeshuri: "
+            self.chat_area.insert(tk.END, prefix, "student_prefix")
+            self.chat_area.insert(tk.END, message + "\n\n", "student_message")
+
+        # Configure text tags with Rwanda theme
+        self.chat_area.tag_configure("tutor_prefix", foreground="#0f5132", font=('Arial', 11, 'bold'))
+        self.chat_area.tag_configure("tutor_message", foreground="#212529")
+        self.chat_area.tag_configure("student_prefix", foreground="#198754", font=('Arial', 11, 'bold'))
+        self.chat_area.tag_configure("student_message", foreground="#212529")
+
+        self.chat_area.see(tk.END)
+
+    def update_difficulty(self, event=None):
+        self.student_data['difficulty_level'] = self.difficulty_var.get()
+        self.save_progress()
+
+        # Prefetched problems were generated for the old level
+        for queue in self.prefetched.values():
+            queue.clear()
+        self.schedule_prefetch()
+
+    @classmethod
+    def profile_files(cls):
+        """Pupil name stored in each kiosk profile -> its progress file"""
+        files = {}
+        if not os.path.isdir(cls.PROFILE_DIR):
+            return files
+        for filename in sorted(os.listdir(cls.PROFILE_DIR)):
+            if not filename.endswith('.json'):
+                continue
+            path = os.path.join(cls.PROFILE_DIR, filename)
+            try:
+                with open(path, 'r') as f:
+                    name = json.load(f).get('student_name')
+            except (OSError, ValueError, AttributeError):
+                continue
+            if name:
+                files.setdefault(name, path)
+        return files
+
+    def profile_path(self, name):
+        """Progress file for a pupil; names that sanitise alike get numbered files"""
+        files = self.profile_files()
+        if name in files:
+            return files[name]
+        stem = re.sub(r'[^\w-]', '_', name)
+        path = os.path.join(self.PROFILE_DIR, stem + '.json')
+        number = 2
+        while os.path.exists(path):
+            path = os.path.join(self.PROFILE_DIR, f"{stem}_{number}.json")
+            number += 1
+        return path
+
+    def profile_names(self):
+        return sorted(self.profile_files())
+
+    def switch_student(self, name):
+        """Kiosk mode: save the current pupil and swap in another one's state.
+
+        Recently used pupils stay in memory, so a swap only reassigns state
+        and refills the existing widgets instead of rebuilding the UI.
+        """
+        name = name.strip()
+        if not name or name == self.student_data['student_name']:
+            return
+        self.save_progress()
+
+        current = self.student_data['student_name']
+        self.profiles[current] = (self.student_data, self.progress_file, self.recent_problems,
+                                  self.coverage, self.fact_mastery, self.transcript)
+        self.profiles.move_to_end(current)
+
+        if name in self.profiles:
+            (self.student_data, self.progress_file, self.recent_problems,
+             self.coverage, self.fact_mastery, self.transcript) = self.profiles.pop(name)
+            self.catalog = MessageCatalog.get(self.student_data['language'])
+            self.generator.language = self.student_data['language']
+        else:
+            self.progress_file = self.profile_path(name)
+            self.student_data = self.new_student_data()
+            self.student_data['student_name'] = name
+            self.load_progress()
+            self.load_student_state()
+            self.transcript = deque(maxlen=self.TRANSCRIPT_LENGTH)
+
+        # Evicted pupils were saved when they were swapped out
+        while len(self.profiles) >= self.PROFILE_CACHE_SIZE:
+            self.profiles.popitem(last=False)
+
+        self.clear_current_problem()
+        self.answer_entry.delete(0, tk.END)
+        self.show_choices([])
+
+        self.difficulty_var.set(self.student_data['difficulty_level'])
+        self.language_var.set(MessageCatalog.LANGUAGES[self.student_data['language']])
+        self.multiple_choice_var.set(self.student_data['multiple_choice'])
+        self.pupil_var.set(name)
+        self.pupil_combo.configure(values=self.profile_names())
+        self.refresh_labels()
+
+        self.chat_area.delete('1.0', tk.END)
+        for timestamp, message, sender in self.transcript:
+            self.show_message(timestamp, message, sender)
+        if not self.transcript:
+            self.add_message(self.catalog.text('welcome'), "tutor")
+
+        # Queued problems were drawn from the previous pupil's coverage and recent problems
+        for queue in self.prefetched.values():
+            queue.clear()
+        self.schedule_prefetch()
+
+    def refresh_labels(self):
+        """Show the window's labels and topic buttons in the session language"""
+        for key, widget in self.catalog_widgets.items():
+            widget.config(text=self.catalog.text(key))
+        for topic, button in self.topic_buttons:
+            button.config(text=self.catalog.topic_label(topic))
+        self.update_progress_display()
+
+    def update_language(self, event=None):
+        names = {name: code for code, name in MessageCatalog.LANGUAGES.items()}
+        self.student_data['language'] = names[self.language_var.get()]
+        self.catalog = MessageCatalog.get(self.student_data['language'])
+        self.generator.language = self.student_data['language']
+        self.save_progress()
+        self.refresh_labels()
+
+        # Prefetched problems may spell numbers in the old language
+        for queue in self.prefetched.values():
+            queue.clear()
+        self.schedule_prefetch()
+
+    def draw_problem(self, kind, queued=()):
+        """Generate a problem the student has not seen recently, without recording it.
+
+        Small topics avoid the ``queued`` problems, which will be shown first.
+        """
+        difficulty = self.student_data['difficulty_level']
+        if self.generator.topics[kind].space == kind:
+            # Small topics are drawn without replacement from their full space
+            space = self.generator.problem_space(kind, difficulty)
+            skip = {space.position(problem) for problem in queued} - {None}
+            problem = self.coverage.sample_unseen(space, self.generator.rng, skip)
+        else:
+            problem = self.generator.generate(kind, difficulty, seen=self.recent_problems, remember=False)
+        # The level it was drawn at, which may have changed by the time it is answered
+        problem['difficulty'] = difficulty
+        return problem
+
+    def schedule_prefetch(self):
+        if not self.prefetch_scheduled:
+            self.prefetch_scheduled = True
+            self.root.after_idle(self.prefetch_next)
+
+    def prefetch_next(self):
+        """Top up one topic queue, then yield back to Tk until all are full"""
+        self.prefetch_scheduled = False
+        for kind, queue in self.prefetched.items():
+            if len(queue) < self.PREFETCH_DEPTH:
+                queue.append(self.draw_problem(kind, queue))
+                self.schedule_prefetch()
+                return
+
+    def next_problem(self, kind):
+        """Take a prefetched problem of this kind, or generate one if none is ready"""
+        # Topics get a queue once they are first used
+        queue = self.prefetched.setdefault(kind, deque())
+        while queue:
+            problem = queue.popleft()
+            # Queued problems may have been shown since they were generated
+            if problem not in self.recent_problems:
+                return problem
+        return self.draw_problem(kind)
+
+    def pose_problem(self, kind):
+        """Show the next problem of the given kind to the student"""
+        problem = self.next_problem(kind)
+        self.recent_problems.add(problem)
+
+        if self.generator.topics[kind].space:
+            self.coverage.record(self.generator.problem_space(kind, problem['difficulty']), problem)
+
+        self.current_kind = problem['kind']
+        self.current_difficulty = problem['difficulty']
+        self.current_topic = problem['topic']
+        self.current_problem = problem['problem']
+        self.current_answer = problem['answer']
+        self.current_steps = self.generator.topics[problem['kind']].hints(problem)
+        self.current_choices = self.distractors.choices(problem) if self.student_data['multiple_choice'] else []
+
+        self.student_data['topics_practiced'].add(problem['topic'])
+        self.hint_count = 0
+        self.add_message(problem['message'], "tutor")
+        self.show_choices(self.current_choices)
+        self.answer_entry.focus()
+
+        self.schedule_prefetch()
+
+    def update_multiple_choice(self):
+        self.student_data['multiple_choice'] = self.multiple_choice_var.get()
+        self.save_progress()
+
+    def show_choices(self, choices):
+        """Show a button per answer choice, or hide the buttons for an empty list"""
+        for button in self.choice_buttons:
+            button.pack_forget()
+        for button, choice in zip(self.choice_buttons, choices):
+            button.config(text=choice, command=lambda choice=choice: self.choose_answer(choice))
+            button.pack(side='left', padx=5)
+        if choices:
+            self.choice_frame.pack(fill='x', padx=10, pady=5)
+        else:
+            self.choice_frame.pack_forget()
+
+    def choose_answer(self, choice):
+        self.answer_entry.delete(0, tk.END)
+        self.answer_entry.insert(0, choice)
+        self.check_answer()
+
+    def get_hint(self):
+        if not self.current_problem:
+            self.add_message(self.catalog.text('select_first'), "tutor")
+            return
+
+        if self.hint_count < len(self.current_steps):
+            hint = self.current_steps[self.hint_count]
+            self.add_message(self.catalog.text('hint', number=self.hint_count + 1, hint=hint), "tutor")
+            self.hint_count += 1
+        else:
+            self.add_message(self.catalog.text('no_more_hints'), "tutor")
+
+    def check_answer(self, event=None):
+        if not self.current_problem:
+            self.add_message(self.catalog.text('select_first'), "tutor")
+            return
+
+        user_answer = self.answer_entry.get().strip()
+        if not user_answer:
+            self.add_message(self.catalog.text('enter_answer'), "tutor")
+            return
+
+        self.add_message(user_answer, "student")
+
+        # Check if answer is correct
+        try:
+            is_correct = self.generator.topics[self.current_kind].check(user_answer, self.current_answer)
+
+            self.record_fact(is_correct)
+            self.log_attempt(is_correct)
+
+            if is_correct:
+                self.student_data['problems_solved'] += 1
+                self.student_data['correct_answers'] += 1
+
+                encouragement = random.choice(self.catalog.messages['encouragements'])
+
+                self.add_message(self.catalog.text('correct', encouragement=encouragement), "tutor")
+
+                # Show complete solution
+                for i, step in enumerate(self.current_steps, 1):
+                    self.add_message(self.catalog.text('step', number=i, step=step), "tutor")
+
+            else:
+                self.student_data['problems_solved'] += 1
+
+                self.add_message(self.catalog.text('incorrect', answer=self.current_answer), "tutor")
+
+                # Show complete solution
+                for i, step in enumerate(self.current_steps, 1):
+                    self.add_message(self.catalog.text('step', number=i, step=step), "tutor")
+
+        except ValueError:
+            self.add_message(self.catalog.text('invalid_answer'), "tutor")
+            return
+
+        # Clear the problem
+        self.current_problem = None
+        self.current_answer = None
+        self.current_steps = []
+        self.current_choices = []
+        self.answer_entry.delete(0, 'end')
+        self.show_choices([])
+
+        # Save progress
+        self.save_progress()
+        self.update_progress_display()
+
+        # Encourage next problem
+        self.add_message(self.catalog.text('next_problem'), "tutor")
+
+    def record_fact(self, is_correct):
+        """Update per-fact mastery counters for topics whose module sets ``FACTS = True``"""
+        if not self.generator.topics[self.current_kind].facts:
+            return
+        space = self.generator.problem_space(self.current_kind, self.current_difficulty)
+        position = space.position({'topic': self.current_topic, 'problem': self.current_problem})
+        if position is not None:
+            self.fact_mastery.record(space, position, is_correct)
+
+    def log_attempt(self, is_correct):
+        """Append the answered problem to the attempt log used by ClassAnalytics"""
+        attempt = {
+            'student': self.student_data['student_name'],
+            'class': self.student_data['class_name'],
+            'kind': self.current_kind,
+            'topic': self.current_topic,
+            'difficulty': self.current_difficulty,
+            'correct': is_correct,
+            'hints': self.hint_count,
+            'timestamp': datetime.now().isoformat(timespec='seconds')
+        }
+        try:
+            if os.path.dirname(self.ATTEMPT_LOG_FILE):
+                os.makedirs(os.path.dirname(self.ATTEMPT_LOG_FILE), exist_ok=True)
+            with open(self.ATTEMPT_LOG_FILE, 'a') as f:
+                f.write(json.dumps(attempt) + "\n")
+        except Exception as e:
+            print(f"Could not log attempt: {e}")
+
+    def get_accuracy(self):
+        if self.student_data['problems_solved'] == 0:
+            return 0.0
+        return (self.student_data['correct_answers'] / self.student_data['problems_solved']) * 100
+
+    def topic_coverage(self):
+        """Share of the current topic's problem space this pupil has seen, or None"""
+        if not self.current_kind or not self.generator.topics[self.current_kind].space:
+            return None
+        return self.coverage.coverage(self.generator.problem_space(self.current_kind, self.current_difficulty))
+
+    def progress_text(self):
+        text = self.catalog.text('progress', solved=self.student_data['problems_solved'],
+                                 accuracy=self.get_accuracy(), level=self.student_data['difficulty_level'])
+        coverage = self.topic_coverage()
+        if coverage is not None:
+            topic = self.generator.topics[self.current_kind]
+            label = self.catalog.topic_label(topic) if topic.space == topic.kind else topic.space_label
+            text += self.catalog.text('coverage', coverage=coverage, topic=label)
+        return text
+
+    def update_progress_display(self):
+        # Update the progress display in the info frame
+        text = self.progress_text()
+        for widget in self.root.winfo_children():
+            if isinstance(widget, tk.Frame) and widget.cget('bg') == '#d1e7dd':
+                for child in widget.winfo_children():
+                    if isinstance(child, tk.Label):
+                        child.config(text=text)
+
+    def save_progress(self):
+        try:
+            # Convert set to list for JSON serialization
+            data_to_save = self.student_data.copy()
+            data_to_save['topics_practiced'] = list(data_to_save['topics_practiced'])
+            data_to_save['recent_problems'] = self.recent_problems.to_list()
+            data_to_save['problem_coverage'] = self.coverage.to_dict()
+            data_to_save['fact_mastery'] = self.fact_mastery.to_dict()
+
+            if os.path.dirname(self.progress_file):
+                os.makedirs(os.path.dirname(self.progress_file), exist_ok=True)
+            with open(self.progress_file, 'w') as f:
+                json.dump(data_to_save, f)
+        except Exception as e:
+            print(f"Could not save progress: {e}")
+
+    def load_progress(self):
+        try:
+            if os.path.exists(self.progress_file):
+                with open(self.progress_file, 'r') as f:
+                    data = json.load(f)
+                    self.student_data.update(data)
+                    # Convert list back to set
+                    self.student_data['topics_practiced'] = set(self.student_data['topics_practiced'])
+        except Exception as e:
+            print(f"Could not load progress: {e}")
+        if self.class_name:
+            self.student_data['class_name'] = self.class_name
+
+    def run(self):
+        self.root.mainloop()
+
+class HeadlessEntry:
+    """Stand-in for the answer Entry widget when the tutor runs without a window"""
+
+    def __init__(self):
+        self.text = ''
+
+    def get(self):
+        return self.text
+
+    def insert(self, index, text):
+        self.text += text
+
+    def delete(self, first, last=None):
+        self.text = ''
+
+    def focus(self):
+        pass
+
+
+class HeadlessTutor(RwandanP2MathTutor):
+    """The tutor's problem, hint and answer loop without Tk, for simulations.
+
+    Messages are kept in the transcript only and prefetching is off; type an
+    answer with ``answer_entry.insert(0, text)`` and call ``check_answer()``.
+    """
+
+    def __init__(self, progress_file, attempt_log_file=None, student_name='Student', rng=None,
+                 class_name=None):
+        self.kiosk = False
+        if attempt_log_file:
+            self.ATTEMPT_LOG_FILE = attempt_log_file
+        self.answer_entry = HeadlessEntry()
+        self.init_state(progress_file, student_name, rng, class_name)
+
+    def show_message(self, timestamp, message, sender):
+        pass
+
+    def show_choices(self, choices):
+        pass
+
+    def update_progress_display(self):
+        pass
+
+    def schedule_prefetch(self):
+        pass
+
+class RecentProblemIndex:
+    """Bounded LRU set of recently seen problem keys for one student.
+
+    Keys are stored as CRC32 checksums so the memory cost per student is
+    fixed by ``capacity`` and the index can be saved in the progress file.
+    """
+
+    def __init__(self, capacity=30, keys=None):
+        self.capacity = capacity
+        self._keys = OrderedDict()
+        for key in keys or []:
+            self._keys[key] = None
+            self._trim()
+
+    @staticmethod
+    def problem_key(problem):
+        """Canonical checksum for a generated problem (topic + problem text)"""
+        text = f"{problem['topic']}|{problem['problem']}"
+        return zlib.crc32(text.encode('utf-8'))
+
+    def __contains__(self, problem):
+        return self.problem_key(problem) in self._keys
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, problem):
+        key = self.problem_key(problem)
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        self._trim()
+
+    def _trim(self):
+        while len(self._keys) > self.capacity:
+            self._keys.popitem(last=False)
+
+    def to_list(self):
+        """Oldest-first list of keys for JSON serialization"""
+        return list(self._keys)
+
+class RwandanP2ProblemGenerator:
+    """Generates P2 curriculum problems without touching the user interface.
+
+    Each topic is a module in ``p2_topics`` (see TopicRegistry) that is handed
+    this generator for its random numbers and the helpers topics share.
+    Problems are dicts with the ``topic`` name, the ``problem`` text, the
+    expected ``answer``, the solution ``steps`` and the ``message`` shown to
+    the student; ``generate`` adds the ``kind``.
+    """
+
+    # Problem spaces do not depend on the random generator, so they are
+    # built once per process and shared by every instance
+    _spaces = {}
+
+    def __init__(self, rng=None, topics=None, language='en'):
+        self.rng = rng or random.Random()
+        self.topics = topics or TopicRegistry.shared()
+        self.language = language  # for number words
+
+    def generate(self, kind, difficulty='Easy', seen=None, max_attempts=10, remember=True):
+        """Generate a problem of the given kind, avoiding problems in ``seen``.
+
+        Small topics can run out of fresh problems, so after ``max_attempts``
+        the last candidate is used even if it was seen recently. With
+        ``remember=False`` the problem is checked against ``seen`` but not
+        added to it.
+        """
+        topic = self.topics[kind]
+        for _ in range(max_attempts):
+            problem = topic.generate(self, difficulty)
+            if seen is None or problem not in seen:
+                break
+        problem['kind'] = kind
+        if seen is not None and remember:
+            seen.add(problem)
+        return problem
+
+    def generate_batch(self, kind, difficulty='Easy', count=1, seen=None):
+        """Generate ``count`` problems of one kind together, for worksheets.
+
+        Problems already in ``seen`` are replaced one at a time by
+        ``generate``; all of them are added to ``seen``.
+        """
+        problems = self.topics[kind].generate_batch(self, difficulty, count)
+        for i, problem in enumerate(problems):
+            problem['kind'] = kind
+            if seen is None:
+                continue
+            if problem in seen:
+                problems[i] = self.generate(kind, difficulty, seen=seen)
+            else:
+                seen.add(problem)
+        return problems
+
+    def problem_space(self, kind, difficulty='Easy'):
+        """Cached ProblemSpaceIndex for a topic with an enumerable problem space.
+
+        A space that is the same at every difficulty is built once and has
+        difficulty None.
+        """
+        topic = self.topics[kind]
+        level = difficulty if topic.space_by_difficulty else None
+        if (kind, level) not in self._spaces:
+            self._spaces[(kind, level)] = ProblemSpaceIndex(
+                topic.space, level, topic.space_params(level), topic.build_problem)
+        return self._spaces[(kind, level)]
+
+    def get_p2_number_range(self, difficulty='Easy'):
+        """Get number ranges appropriate for P2 curriculum (0-999)"""
+        if difficulty == 'Easy':
+            return (1, 50)
+        elif difficulty == 'Medium':
+            return (10, 200)
+        else:  # Hard
+            return (50, 999)
+
+    def number_to_words(self, num):
+        """Convert number to words in the session language"""
+        return MessageCatalog.get(self.language).number_words[num]
+
+class Topic:
+    """One topic on offer: its button label and how to generate, check and hint.
+
+    The topic's module is only imported the first time the topic is used.
+    """
+
+    def __init__(self, kind, label, path):
+        self.kind = kind
+        self.label = label
+        self.path = path
+        self._module = None
+
+    @property
+    def module(self):
+        if self._module is None and self.path:
+            spec = importlib.util.spec_from_file_location(f"p2_topics.{self.kind}", self.path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._module = module
+        return self._module
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    @property
+    def space(self):
+        """Name of the topic's enumerable problem space, or None if it has none"""
+        if not hasattr(self.module, 'enumerate_params'):
+            return None
+        return getattr(self.module, 'SPACE', self.kind)
+
+    @property
+    def facts(self):
+        """Whether pupils' accuracy is counted per problem of the space"""
+        return getattr(self.module, 'FACTS', False)
+
+    @property
+    def answer_limit(self):
+        """Largest number an answer may hold, 999 unless the module sets ``ANSWER_LIMIT``"""
+        return getattr(self.module, 'ANSWER_LIMIT', 999)
+
+    @property
+    def options(self):
+        """Text answers the topic's questions choose from, offered in multiple choice"""
+        return getattr(self.module, 'OPTIONS', [])
+
+    def distractors(self, problems):
+        """Likely wrong answers for each problem, if the module has ``distractors``"""
+        distractors = getattr(self.module, 'distractors', None)
+        return distractors(problems) if distractors else [[] for _ in problems]
+
+    @property
+    def space_label(self):
+        """What reports call the problem space: the button label, or the ``SPACE`` name"""
+        if self.space == self.kind:
+            return self.label
+        return self.space.replace('_', ' ').capitalize()
+
+    @property
+    def space_by_difficulty(self):
+        return getattr(self.module, 'SPACE_BY_DIFFICULTY', False)
+
+    def generate(self, generator, difficulty):
+        return self.module.generate(generator, difficulty)
+
+    def generate_batch(self, generator, difficulty, count):
+        """``count`` problems, in one go if the module has ``generate_batch``"""
+        generate_batch = getattr(self.module, 'generate_batch', None)
+        if generate_batch:
+            return generate_batch(generator, difficulty, count)
+        return [self.generate(generator, difficulty) for _ in range(count)]
+
+    def space_params(self, difficulty):
+        if self.space_by_difficulty:
+            return self.module.enumerate_params(difficulty)
+        return self.module.enumerate_params()
+
+    def build_problem(self, *params):
+        problem = self.module.build_problem(*params)
+        problem['kind'] = self.kind
+        return problem
+
+    def check(self, user_answer, answer):
+        """Whether the student's answer is right (raises ValueError if it is not a number)"""
+        check = getattr(self.module, 'check', None)
+        if check:
+            return check(user_answer, answer)
+        if isinstance(answer, str):
+            # For text answers (like units, shapes, probability)
+            return user_answer.lower().strip() == answer.lower().strip()
+        # For numeric answers
+        return float(user_answer) == float(answer)
+
+    def hints(self, problem):
+        """Hints given one at a time, the solution steps unless the module says otherwise"""
+        hints = getattr(self.module, 'hints', None)
+        return hints(problem) if hints else problem['steps']
+
+class TopicRegistry:
+    """The P2 topics: every topic module found in ``TOPIC_DIR``.
+
+    A topic module is a ``<kind>.py`` file whose docstring starts with its
+    button label on the first line. It defines ``generate(generator,
+    difficulty)`` returning a problem dict, drawing random numbers from
+    ``generator.rng``, and may define ``check(user_answer, answer)``,
+    ``hints(problem)`` and, for worksheets, ``generate_batch(generator,
+    difficulty, count)``. A topic small enough to list in full also defines
+    ``build_problem(*params)`` and ``enumerate_params()`` listing the
+    arguments of every problem, and pupils then see every problem before any
+    repeats. ``SPACE`` names the list if it only covers some of the topic's
+    problems, and with ``SPACE_BY_DIFFICULTY = True`` the list depends on the
+    level and is ``enumerate_params(difficulty)``. ``FACTS = True`` counts
+    pupils' accuracy per problem of the list for the teacher's report. For
+    multiple choice, ``OPTIONS`` lists the text answers the questions choose
+    from, and ``distractors(problems)`` gives likely wrong answers for each
+    problem of a list. ``ANSWER_LIMIT`` raises the largest number
+    ``--verify`` accepts in an answer from 999. Discovery only reads the first line, so schools can
+    add topics without editing the tutor and only pay for the ones pupils
+    actually use.
+    """
+
+    TOPIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'p2_topics')
+
+    # Curriculum order of the topic buttons; other topics follow alphabetically
+    ORDER = [
+        'numeration_problem',
+        'comparison_problem',
+        'addition_problem',
+        'subtraction_problem',
+        'multiplication_problem',
+        'division_problem',
+        'length_measurement_problem',
+        'capacity_measurement_problem',
+        'mass_measurement_problem',
+        'unit_conversion_problem',
+        'geometry_problem',
+        'perimeter_problem',
+        'probability_problem',
+        'word_problem'
+    ]
+
+    _shared = None
+
+    def __init__(self, directory=None):
+        self.topics = OrderedDict()
+        self.discover(directory or self.TOPIC_DIR)
+
+    @classmethod
+    def shared(cls):
+        """The registry for the default topic directory, discovered once per process"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def discover(self, directory):
+        if not os.path.isdir(directory):
+            return
+        order = {kind: position for position, kind in enumerate(self.ORDER)}
+        names = sorted(os.listdir(directory),
+                       key=lambda name: (order.get(os.path.splitext(name)[0], len(order)), name))
+        for name in names:
+            kind, extension = os.path.splitext(name)
+            if extension != '.py' or kind.startswith('_') or kind in self.topics:
+                continue
+            path = os.path.join(directory, name)
+            with open(path, encoding='utf-8') as module_file:
+                label = module_file.readline().strip().strip('"\'').strip()
+            self.topics[kind] = Topic(kind, label or kind, path)
+
+    def kinds(self):
+        return list(self.topics)
+
+    def __contains__(self, kind):
+        return kind in self.topics
+
+    def __getitem__(self, kind):
+        return self.topics[kind]
+
+    def __iter__(self):
+        return iter(self.topics.values())
+
+class MessageCatalog:
+    """Tutor messages and number words for one language.
+
+    Catalogues are plain format strings compiled with the module, and the
+    number word tables for 0-999 are built once per process and shared by
+    every session, so switching language is a dictionary swap.
+    """
+
+    LANGUAGES = {'en': 'English', 'rw': 'Ikinyarwanda'}
+
+    MESSAGES = {
+        'en': {
+            'welcome': "🇷🇼 Muraho! Welcome to Rwandan P2 Math Tutor! Choose a topic to practice mathematics.",
+            'select_first': "Please select a problem type first!",
+            'enter_answer': "Please enter your answer!",
+            'invalid_answer': "Please enter a valid answer!",
+            'hint': "💡 Hint {number}: {hint}",
+            'no_more_hints': "💡 No more hints available! Try to solve it with the steps provided.",
+            'encouragements': [
+                "🎉 Byiza cyane! (Very good!)",
+                "👏 Ni ukuri! (That's correct!)",
+                "⭐ Wakoze neza! (Well done!)",
+                "🌟 Excellent work!",
+                "🎊 Urakoze! (Thank you!) Perfect answer!"
+            ],
+            'correct': "{encouragement} You got it right!\n\nHere's the complete solution:",
+            'incorrect': "Ntabwo ari ukuri (Not quite right). The correct answer is {answer}.\n\nLet me show you how to solve it:",
+            'step': "Step {number}: {step}",
+            'next_problem': "Witeguye indi nkuru? (Ready for another problem?) Choose a topic above! 🚀",
+            'subtitle': "Primary Two Mathematics - Republic of Rwanda Curriculum",
+            'progress': "Problems Solved: {solved} | Accuracy: {accuracy:.1f}% | Level: {level}",
+            'coverage': " | Seen {coverage:.0%} of {topic} problems",
+            'choose_topic': "Choose P2 Mathematics Topic:",
+            'difficulty': "Difficulty:",
+            'language': "Language:",
+            'multiple_choice': "Multiple choice",
+            'pupil': "Pupil:",
+            'switch_pupil': "Switch Pupil",
+            'your_answer': "Your Answer:",
+            'check_answer': "Check Answer",
+            'get_hint': "Get Hint",
+            # Topic buttons use the first line of the topic module's docstring
+            'topic_labels': {}
+        },
+        'rw': {
+            'welcome': "🇷🇼 Muraho! Murakaza neza kuri Rwandan P2 Math Tutor! Hitamo isomo ushaka kwitorezamo imibare.",
+            'select_first': "Banza uhitemo ubwoko bw'ikibazo!",
+            'enter_answer': "Andika igisubizo cyawe!",
+            'invalid_answer': "Andika igisubizo gikwiye!",
+            'hint': "💡 Inama ya {number}: {hint}",
+            'no_more_hints': "💡 Nta zindi nama zisigaye! Gerageza kugikemura ukoresheje intambwe wahawe.",
+            'encouragements': [
+                "🎉 Byiza cyane!",
+                "👏 Ni ukuri!",
+                "⭐ Wakoze neza!",
+                "🌟 Ni akazi keza cyane!",
+                "🎊 Urakoze! Igisubizo ni cyo!"
+            ],
+            'correct': "{encouragement} Wabibonye!\n\nDore uko gikemurwa cyose:",
+            'incorrect': "Ntabwo ari ukuri. Igisubizo nyacyo ni {answer}.\n\nReka nkwereke uko gikemurwa:",
+            'step': "Intambwe ya {number}: {step}",
+            'next_problem': "Witeguye ikindi kibazo? Hitamo isomo hejuru! 🚀",
+            'subtitle': "Imibare y'Umwaka wa Kabiri w'Amashuri Abanza - Integanyanyigisho y'u Rwanda",
+            'progress': "Ibibazo byakemuwe: {solved} | Ibisubizo by'ukuri: {accuracy:.1f}% | Urwego: {level}",
+            'coverage': " | Wabonye {coverage:.0%} by'ibibazo bya {topic}",
+            'choose_topic': "Hitamo isomo ry'imibare rya P2:",
+            'difficulty': "Urwego:",
+            'language': "Ururimi:",
+            'multiple_choice': "Hitamo igisubizo",
+            'pupil': "Umunyeshuri:",
+            'switch_pupil': "Hindura umunyeshuri",
+            'your_answer': "Igisubizo cyawe:",
+            'check_answer': "Genzura igisubizo",
+            'get_hint': "Saba inama",
+            # Topics added by a school keep their docstring label
+            'topic_labels': {
+                'numeration_problem': "Imibare 0-999",
+                'addition_problem': "Guteranya (kugeza kuri 999)",
+                'subtraction_problem': "Gukuramo (kugeza kuri 999)",
+                'multiplication_problem': "Gukuba",
+                'division_problem': "Kugabanya",
+                'comparison_problem': "Kugereranya imibare",
+                'length_measurement_problem': "Gupima uburebure",
+                'mass_measurement_problem': "Gupima uburemere",
+                'capacity_measurement_problem': "Gupima ingano",
+                'unit_conversion_problem': "Guhindura ibipimo",
+                'geometry_problem': "Amashusho",
+                'perimeter_problem': "Umuzenguruko",
+                'probability_problem': "Amahirwe",
+                'word_problem': "Ibibazo byanditse",
+                'money_problem': "Amafaranga (Rwf)"
+            }
+        }
+    }
+
+    _number_tables = {}
+    _catalogs = {}
+
+    def __init__(self, language='en'):
+        self.language = language
+        self.messages = self.MESSAGES[language]
+        self.number_words = self.number_word_table(language)
+
+    @classmethod
+    def get(cls, language='en'):
+        """Shared catalogue for a language, created on first use"""
+        if language not in cls._catalogs:
+            cls._catalogs[language] = cls(language)
+        return cls._catalogs[language]
+
+    def text(self, key, **values):
+        template = self.messages[key]
+        return template.format(**values) if values else template
+
+    def topic_label(self, topic):
+        """A topic's button label in this language"""
+        return self.messages['topic_labels'].get(topic.kind, topic.label)
+
+    @classmethod
+    def number_word_table(cls, language='en'):
+        """Tuple of number words for 0-999, indexed by the number"""
+        if language not in cls._number_tables:
+            if language == 'rw':
+                words = cls.kinyarwanda_number_words
+            else:
+                words = cls.english_number_words
+            cls._number_tables[language] = tuple(words(num) for num in range(1000))
+        return cls._number_tables[language]
+
+    @staticmethod
+    def english_number_words(num):
+        """Convert a number from 0 to 999 to English words"""
+        if num == 0:
+            return "zero"
+
+        ones = ["", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine",
+                "ten", "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen",
+                "seventeen", "eighteen", "nineteen"]
+
+        tens = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
+
+        result = ""
+
+        if num >= 100:
+            result += ones[num // 100] + " hundred"
+            num %= 100
+            if num > 0:
+                result += " "
+
+        if num >= 20:
+            result += tens[num // 10]
+            num %= 10
+            if num > 0:
+                result += "-" + ones[num]
+        elif num > 0:
+            result += ones[num]
+
+        return result
+
+    @staticmethod
+    def kinyarwanda_number_words(num):
+        """Convert a number from 0 to 999 to Kinyarwanda counting words"""
+        if num == 0:
+            return "zeru"
+
+        ones = ["", "rimwe", "kabiri", "gatatu", "kane", "gatanu", "gatandatu",
+                "karindwi", "umunani", "icyenda"]
+
+        tens = ["", "icumi", "makumyabiri", "mirongo itatu", "mirongo ine", "mirongo itanu",
+                "mirongo itandatu", "mirongo irindwi", "mirongo inani", "mirongo icyenda"]
+
+        hundreds = ["", "ijana", "magana abiri", "magana atatu", "magana ane", "magana atanu",
+                    "magana atandatu", "magana arindwi", "magana inani", "magana cyenda"]
+
+        parts = []
+        if num >= 100:
+            parts.append(hundreds[num // 100])
+            num %= 100
+        if num >= 10:
+            # "icumi na rimwe" is said "cumi na rimwe"
+            parts.append("cumi" if num // 10 == 1 and num % 10 else tens[num // 10])
+            num %= 10
+        if num > 0:
+            parts.append(ones[num])
+
+        result = parts[0]
+        for part in parts[1:]:
+            # "na" elides before a vowel: "cumi n'icyenda"
+            result += f" n'{part}" if part[0] in "aeiou" else f" na {part}"
+        return result
+
+class DistractorGenerator:
+    """Wrong answer choices for multiple-choice mode, modelled on common
+    P2 misconceptions.
+
+    Topics supply their own misconceptions through ``distractors`` in the
+    topic module. ``batch`` hands each topic all of a worksheet's problems
+    at once (forgotten carry for every addition, reversed subtraction for
+    every subtraction, and so on) before filling up each problem's choices,
+    and never offers the true answer twice.
+    """
+
+    CHOICES = 4
+
+    def __init__(self, rng=None, topics=None):
+        self.rng = rng or random.Random()
+        self.topics = topics or TopicRegistry.shared()
+
+    def choices(self, problem):
+        return self.batch([problem])[0]
+
+    def batch(self, problems):
+        """Shuffled answer choices (strings, true answer included) for each problem"""
+        candidates = [[] for _ in problems]
+        by_kind = {}
+        for i, problem in enumerate(problems):
+            if problem.get('kind') in self.topics:
+                by_kind.setdefault(problem['kind'], []).append(i)
+        for kind, positions in by_kind.items():
+            wrong = self.topics[kind].distractors([problems[i] for i in positions])
+            for i, choices in zip(positions, wrong):
+                candidates[i] += choices
+
+        return [self._fill(problem, wrong) for problem, wrong in zip(problems, candidates)]
+
+    def _fill(self, problem, wrong):
+        answer = str(problem['answer'])
+        choices = [answer]
+        seen = {answer.lower()}
+
+        def offer(choice):
+            choice = str(choice)
+            if len(choices) < self.CHOICES and choice.lower() not in seen and not choice.startswith('-'):
+                choices.append(choice)
+                seen.add(choice.lower())
+
+        for choice in wrong:
+            offer(choice)
+
+        options = self.topics[problem['kind']].options if problem.get('kind') in self.topics else []
+        if answer in options:
+            for choice in options:
+                offer(choice)
+        elif answer.isdigit():
+            value = int(answer)
+            if len(answer) == 1:
+                # Keep digits and small counts to single digits
+                for change in (1, -1, 2, -2, 3, -3):
+                    if 0 <= value + change <= 9:
+                        offer(value + change)
+            else:
+                for change in (10, -10, 1, -1, 2, 100):
+                    offer(value + change)
+        elif answer in self._number_words():
+            language, value = self._number_words()[answer]
+            words = MessageCatalog.get(language).number_words
+            for change in (1, -1, 10, -10, 100, -100):
+                if 0 < value + change < 1000:
+                    offer(words[value + change])
+
+        self.rng.shuffle(choices)
+        return choices
+
+    _number_lookup = None
+
+    @classmethod
+    def _number_words(cls):
+        """Number words of every language, mapped to (language, number)"""
+        if cls._number_lookup is None:
+            cls._number_lookup = {word: (language, num)
+                                  for language in MessageCatalog.LANGUAGES
+                                  for num, word in enumerate(MessageCatalog.get(language).number_words)}
+        return cls._number_lookup
+
+class ProblemSpaceIndex:
+    """Every distinct problem of one enumerable space, held compactly.
+
+    Problems are deduplicated by their RecentProblemIndex key and kept in a
+    fixed order, so a problem can be referred to by its position. Only the
+    builder arguments and the prompt text are kept per problem: keys,
+    positions and answers live in arrays, and the problem dict is built
+    again when it is served. ``difficulty`` is None for spaces that are the
+    same at every level.
+    """
+
+    def __init__(self, space, difficulty, params, build):
+        self.space = space
+        self.difficulty = difficulty
+        self.build = build
+        self.params = []
+        self.prompts = []
+        positions = {}
+        answer_ids = {}
+        self.answer_ids = array('H')
+        for args in params:
+            problem = build(*args)
+            key = RecentProblemIndex.problem_key(problem)
+            if key not in positions:
+                positions[key] = len(self.params)
+                self.params.append(args)
+                self.prompts.append(problem['problem'])
+                self.answer_ids.append(answer_ids.setdefault(problem['answer'], len(answer_ids)))
+        self.answer_values = list(answer_ids)
+        # Sorted keys with the matching positions, for binary search
+        self.keys = array('I', sorted(positions))
+        self.positions = array('I', (positions[key] for key in self.keys))
+
+    def __len__(self):
+        return len(self.params)
+
+    def problem(self, position):
+        return self.build(*self.params[position])
+
+    def prompt(self, position):
+        return self.prompts[position]
+
+    def answer(self, position):
+        return self.answer_values[self.answer_ids[position]]
+
+    def position(self, problem):
+        """Position of a generated problem in this space, or None"""
+        key = RecentProblemIndex.problem_key(problem)
+        found = bisect.bisect_left(self.keys, key)
+        if found < len(self.keys) and self.keys[found] == key:
+            return self.positions[found]
+        return None
+
+class ProblemCoverage:
+    """Which problems of each enumerable space a student has already seen.
+
+    One byte per problem is kept for every space the student has practised,
+    keyed by ``"space:difficulty"``, or just ``"space"`` for spaces that are
+    the same at every difficulty.
+    """
+
+    def __init__(self, seen=None):
+        self.seen = {}
+        for name, hex_bytes in (seen or {}).items():
+            self.seen[name] = bytearray.fromhex(hex_bytes)
+
+    @staticmethod
+    def name(index):
+        if index.difficulty is None:
+            return index.space
+        return f"{index.space}:{index.difficulty}"
+
+    def seen_bitmap(self, index):
+        """The space's bitmap, or None if nothing in it has been seen"""
+        bitmap = self.seen.get(self.name(index))
+        return bitmap if bitmap is not None and len(bitmap) == len(index) else None
+
+    def _bitmap(self, index):
+        bitmap = self.seen_bitmap(index)
+        if bitmap is None:
+            bitmap = self.seen[self.name(index)] = bytearray(len(index))
+        return bitmap
+
+    def record(self, index, problem):
+        position = index.position(problem)
+        if position is not None:
+            self._bitmap(index)[position] = 1
+        return position
+
+    def coverage(self, index):
+        """Fraction of the space that has been seen, from 0.0 to 1.0"""
+        bitmap = self.seen_bitmap(index)
+        if bitmap is None:
+            return 0.0
+        return (len(bitmap) - bitmap.count(0)) / len(bitmap)
+
+    def sample_unseen(self, index, rng, skip=()):
+        """Pick a problem not seen yet, uniformly, starting over once all have been seen.
+
+        Positions in ``skip`` are left out while any other unseen one remains.
+        """
+        bitmap = self._bitmap(index)
+        if bitmap.count(0) == 0:
+            bitmap[:] = bytearray(len(bitmap))
+        unseen = bitmap.count(0) - sum(1 for position in skip if bitmap[position] == 0)
+        if unseen == 0:
+            # Every unseen problem is skipped; any other comes round again next
+            others = [position for position in range(len(bitmap)) if position not in skip]
+            return index.problem(rng.choice(others or range(len(bitmap))))
+        # The k-th unseen, not skipped position for a random k
+        position = -1
+        for _ in range(rng.randrange(unseen) + 1):
+            position = bitmap.find(0, position + 1)
+            while position in skip:
+                position = bitmap.find(0, position + 1)
+        return index.problem(position)
+
+    def to_dict(self):
+        return {name: bitmap.hex() for name, bitmap in self.seen.items()}
+
+class FactMastery:
+    """Dense attempt and correct-answer counters per fact for one student.
+
+    Counters are kept as two ``array('I')`` rows per fact space (the
+    problem space of a topic with ``FACTS = True``), keyed by
+    ``"space:difficulty"``, in the same order as the space's facts.
+    """
+
+    def __init__(self, counters=None):
+        self.counters = {}
+        for name, (attempts, correct) in (counters or {}).items():
+            self.counters[name] = (array('I', attempts), array('I', correct))
+
+    def _counters(self, space, create=True):
+        name = f"{space.space}:{space.difficulty}"
+        if name not in self.counters or len(self.counters[name][0]) != len(space):
+            if not create:
+                return None
+            self.counters[name] = (array('I', bytes(4 * len(space))),
+                                   array('I', bytes(4 * len(space))))
+        return self.counters[name]
+
+    def record(self, space, index, is_correct):
+        attempts, correct = self._counters(space)
+        attempts[index] += 1
+        if is_correct:
+            correct[index] += 1
+
+    def accuracy(self, space, index):
+        """Share of correct answers for one fact, or None if never attempted"""
+        counters = self._counters(space, create=False)
+        if counters is None or counters[0][index] == 0:
+            return None
+        attempts, correct = counters
+        return correct[index] / attempts[index]
+
+    def to_dict(self):
+        return {name: [list(attempts), list(correct)]
+                for name, (attempts, correct) in self.counters.items()}
+
+class WorksheetRenderer:
+    """Streams printable HTML worksheets and matching answer keys.
+
+    Pages are generated, written and discarded one at a time, so memory use
+    stays the same however many pages are rendered. Open the HTML files in a
+    browser to print them or save them as PDF.
+    """
+
+    PAGE_STYLE = """<style>
+body { font-family: Arial, sans-serif; color: #212529; }
+.page { page-break-after: always; padding: 1.5cm; }
+h1 { color: #0f5132; font-size: 18pt; margin: 0 0 0.3cm 0; }
+.pupil { margin-bottom: 0.6cm; }
+ol li { margin-bottom: 0.9cm; white-space: pre-line; }
+.choices { white-space: normal; margin-top: 0.2cm; }
+.choices span { margin-right: 1.2cm; }
+.steps { color: #198754; font-size: 10pt; }
+</style>"""
+
+    CHOICE_LETTERS = "ABCDEFGH"
+    WORKSHEET_FILE = 'rwanda_p2_worksheets.html'
+    ANSWER_KEY_FILE = 'rwanda_p2_answer_key.html'
+
+    def __init__(self, generator=None, problems_per_page=10,
+                 title="Rwandan P2 Mathematics Worksheet", multiple_choice=False):
+        self.generator = generator or RwandanP2ProblemGenerator()
+        self.problems_per_page = problems_per_page
+        self.title = title
+        self.multiple_choice = multiple_choice
+        self.distractors = DistractorGenerator(self.generator.rng, self.generator.topics)
+
+    def pages(self, kinds, difficulty='Easy', page_count=1):
+        """Yield one list of problems per page, cycling through ``kinds``"""
+        kinds = itertools.cycle(kinds)
+        for _ in range(page_count):
+            seen = RecentProblemIndex(capacity=self.problems_per_page)
+            page_kinds = [next(kinds) for _ in range(self.problems_per_page)]
+            # One batch per kind, so a page's column sums are solved together
+            batches = {kind: iter(self.generator.generate_batch(kind, difficulty, page_kinds.count(kind), seen))
+                       for kind in dict.fromkeys(page_kinds)}
+            yield [next(batches[kind]) for kind in page_kinds]
+
+    def render(self, worksheet_file, answer_key_file, kinds, difficulty='Easy', page_count=1):
+        """Write worksheets and answer keys to two open text files"""
+        worksheet_file.write(self._document_start(f"{self.title} ({difficulty})"))
+        answer_key_file.write(self._document_start(f"{self.title} ({difficulty}) - Answer Key"))
+
+        for number, problems in enumerate(self.pages(kinds, difficulty, page_count), 1):
+            choices = self.distractors.batch(problems) if self.multiple_choice else [[] for _ in problems]
+            worksheet_file.write(self._worksheet_page(number, problems, choices, difficulty))
+            answer_key_file.write(self._answer_key_page(number, problems, choices, difficulty))
+
+        worksheet_file.write("</body>\n</html>\n")
+        answer_key_file.write("</body>\n</html>\n")
+
+    def render_files(self, worksheet_path, answer_key_path, kinds, difficulty='Easy', page_count=1):
+        with open(worksheet_path, 'w', encoding='utf-8') as worksheet_file, \
+                open(answer_key_path, 'w', encoding='utf-8') as answer_key_file:
+            self.render(worksheet_file, answer_key_file, kinds, difficulty, page_count)
+
+    def _document_start(self, title):
+        return (f"<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+                f"<title>{html.escape(title)}</title>\n{self.PAGE_STYLE}\n</head>\n<body>\n")
+
+    def _choice_line(self, choices):
+        if not choices:
+            return ""
+        options = "".join(f"<span>{letter}) {html.escape(choice)}</span>"
+                          for letter, choice in zip(self.CHOICE_LETTERS, choices))
+        return f"<div class=\"choices\">{options}</div>"
+
+    def _worksheet_page(self, number, problems, choices, difficulty):
+        items = "".join(f"<li>{html.escape(problem['message'])}{self._choice_line(options)}</li>\n"
+                        for problem, options in zip(problems, choices))
+        return (f"<section class=\"page\">\n<h1>{html.escape(self.title)} - Page {number}</h1>\n"
+                f"<div class=\"pupil\">Name: ______________________ Level: {html.escape(difficulty)}</div>\n"
+                f"<ol>\n{items}</ol>\n</section>\n")
+
+    def _answer_key_page(self, number, problems, choices, difficulty):
+        items = []
+        for problem, options in zip(problems, choices):
+            steps = "<br>".join(html.escape(step) for step in problem['steps'])
+            answer = str(problem['answer'])
+            if answer in options:
+                answer = f"{self.CHOICE_LETTERS[options.index(answer)]}) {answer}"
+            items.append(f"<li><b>{html.escape(answer)}</b> - "
+                         f"{html.escape(problem['problem'])}\n"
+                         f"<div class=\"steps\">{steps}</div></li>\n")
+        return (f"<section class=\"page\">\n<h1>Answer Key - Page {number} ({html.escape(difficulty)})</h1>\n"
+                f"<ol>\n{''.join(items)}</ol>\n</section>\n")
+
+class ClassAnalytics:
+    """Per-class teacher analytics, maintained incrementally from attempt logs.
+
+    Attempts, correct answers and hints are summed per class, topic and
+    difficulty and per class, topic and ISO week. ``update_from_log`` only
+    reads the part of the log written since the last update, so reports
+    never rescan old history.
+    """
+
+    REPORT_EXAMPLES = 3  # problems nobody has seen, listed per space
+    TREND_WEEKS = 6      # most recent weeks shown per topic
+
+    def __init__(self):
+        self.totals = {}   # "class|topic|difficulty" -> [attempts, correct, hints]
+        self.weekly = {}   # "class|topic|week" -> [attempts, correct, hints]
+        self.log_offset = 0
+
+    def add_attempt(self, attempt):
+        week = datetime.fromisoformat(attempt['timestamp']).strftime('%G-W%V')
+        keys = [
+            (self.totals, f"{attempt['class']}|{attempt['topic']}|{attempt['difficulty']}"),
+            (self.weekly, f"{attempt['class']}|{attempt['topic']}|{week}")
+        ]
+        for table, key in keys:
+            counts = table.setdefault(key, [0, 0, 0])
+            counts[0] += 1
+            counts[1] += 1 if attempt['correct'] else 0
+            counts[2] += attempt['hints']
+
+    def update_from_log(self, log_path):
+        """Fold in attempts appended to the log since the last update"""
+        if not os.path.exists(log_path):
+            return 0
+        added = 0
+        with open(log_path, 'rb') as f:
+            f.seek(self.log_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # attempt still being written
+                self.log_offset += len(line)
+                if line.strip():
+                    self.add_attempt(json.loads(line))
+                    added += 1
+        return added
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump({'totals': self.totals, 'weekly': self.weekly,
+                       'log_offset': self.log_offset}, f)
+
+    @classmethod
+    def load(cls, path):
+        analytics = cls()
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                data = json.load(f)
+            analytics.totals = data['totals']
+            analytics.weekly = data['weekly']
+            analytics.log_offset = data['log_offset']
+        return analytics
+
+    def classes(self):
+        return sorted({key.split('|')[0] for key in self.totals})
+
+    def summary(self, class_name, by='topic'):
+        """Counts for one class grouped by 'topic' or 'difficulty'"""
+        position = 1 if by == 'topic' else 2
+        grouped = {}
+        for key, counts in self.totals.items():
+            parts = key.split('|')
+            if parts[0] != class_name:
+                continue
+            total = grouped.setdefault(parts[position], [0, 0, 0])
+            for i in range(3):
+                total[i] += counts[i]
+        return grouped
+
+    def trend(self, class_name, topic):
+        """Weekly (week, attempts, correct, hints) for one class and topic, oldest first"""
+        prefix = f"{class_name}|{topic}|"
+        return sorted((key[len(prefix):], *counts)
+                      for key, counts in self.weekly.items() if key.startswith(prefix))
+
+    @staticmethod
+    def load_pupils(paths):
+        """Saved progress of every pupil whose progress file exists"""
+        pupils = []
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, 'r') as f:
+                    pupils.append(json.load(f))
+            except (OSError, ValueError) as e:
+                print(f"Could not load progress from {path}: {e}")
+        return pupils
+
+    def coverage_report(self, class_name, pupils, generator):
+        """Lines on how much of each problem space a class's pupils have seen.
+
+        Each space gives the average share seen by the pupils who practised
+        it, and the first few problems none of them has seen yet.
+        """
+        coverages = [ProblemCoverage(pupil.get('problem_coverage'))
+                     for pupil in pupils if pupil.get('class_name', 'P2') == class_name]
+        lines = []
+        names = {name for coverage in coverages for name in coverage.seen}
+        for label, index in self._problem_spaces(generator, names):
+            practised = [coverage for coverage in coverages if coverage.seen_bitmap(index) is not None]
+            if not practised:
+                continue
+            average = sum(coverage.coverage(index) for coverage in practised) / len(practised)
+            bitmaps = [coverage.seen_bitmap(index) for coverage in practised]
+            unseen = [position for position in range(len(index))
+                      if not any(bitmap[position] for bitmap in bitmaps)]
+            line = f"    {label}: {average:.1%} seen on average by {len(practised)} pupil(s)"
+            if unseen:
+                examples = ", ".join(f"{index.prompt(position)} → {index.answer(position)}"
+                                     for position in unseen[:self.REPORT_EXAMPLES])
+                line += f"; nobody has seen {examples}"
+                if len(unseen) > self.REPORT_EXAMPLES:
+                    line += f" and {len(unseen) - self.REPORT_EXAMPLES} more"
+            lines.append(line)
+        return lines
+
+    def mastery_report(self, class_name, pupils, generator):
+        """Lines listing the facts a class's pupils answer worst, per fact space.
+
+        A fact's accuracy is the average over the pupils who attempted it.
+        """
+        masteries = [FactMastery(pupil.get('fact_mastery'))
+                     for pupil in pupils if pupil.get('class_name', 'P2') == class_name]
+        lines = []
+        names = {name for mastery in masteries for name in mastery.counters}
+        for label, index in self._problem_spaces(generator, names):
+            facts = []
+            for position in range(len(index)):
+                accuracies = [accuracy for accuracy in (mastery.accuracy(index, position) for mastery in masteries)
+                              if accuracy is not None]
+                if accuracies:
+                    facts.append((sum(accuracies) / len(accuracies), position, len(accuracies)))
+            if not facts:
+                continue
+            weakest = ", ".join(f"{index.prompt(position)} → {index.answer(position)} "
+                                f"({accuracy:.0%} correct, {attempted} pupil(s))"
+                                for accuracy, position, attempted in sorted(facts)[:self.REPORT_EXAMPLES])
+            lines.append(f"    {label}: {weakest}")
+        return lines
+
+    @staticmethod
+    def _problem_spaces(generator, names):
+        """(label, ProblemSpaceIndex) for each saved space name the topics still have"""
+        spaces = {}
+        for kind in generator.topics.kinds():
+            if generator.topics[kind].space:
+                spaces.setdefault(generator.topics[kind].space, kind)
+        for name in sorted(names):
+            space, _, difficulty = name.partition(':')
+            if space not in spaces:
+                continue
+            index = generator.problem_space(spaces[space], difficulty or 'Easy')
+            if ProblemCoverage.name(index) != name:
+                continue  # saved before the space changed shape
+            label = generator.topics[spaces[space]].space_label
+            yield label + (f" ({difficulty})" if difficulty else ""), index
+
+    def report(self, class_name, pupils=(), generator=None):
+        """Plain-text report of accuracy, hint use and weekly trends for one class.
+
+        With the class's saved ``pupils`` progress it also covers how much
+        of each problem space they have seen and their weakest facts.
+        """
+        lines = [f"Class {class_name}"]
+        for by in ('topic', 'difficulty'):
+            lines.append(f"  By {by}:")
+            grouped = self.summary(class_name, by)
+            # Weakest first, so the topics a class struggles with stand out
+            for name, (attempts, correct, hints) in sorted(
+                    grouped.items(), key=lambda item: item[1][1] / item[1][0]):
+                lines.append(f"    {name}: {attempts} attempts, "
+                             f"{correct / attempts * 100:.1f}% correct, "
+                             f"{hints / attempts:.1f} hints per problem")
+        lines.append(f"  Weekly trend (last {self.TREND_WEEKS} weeks):")
+        for topic in sorted(self.summary(class_name, 'topic')):
+            weeks = self.trend(class_name, topic)[-self.TREND_WEEKS:]
+            lines.append(f"    {topic}: " + ", ".join(f"{week} {correct / attempts * 100:.0f}% of {attempts}"
+                                                    for week, attempts, correct, hints in weeks))
+        generator = generator or RwandanP2ProblemGenerator()
+        for heading, section in (("Problems seen", self.coverage_report(class_name, pupils, generator)),
+                                 ("Weakest facts", self.mastery_report(class_name, pupils, generator))):
+            if section:
+                lines.append(f"  {heading}:")
+                lines += section
+        return "\n".join(lines)
+
+class ProblemBank:
+    """Read-only bank of generated problems in a memory-mapped binary file.
+
+    Layout (little-endian): a header, fixed-width records sorted by problem
+    key, then a UTF-8 string heap that the records point into. Problems
+    whose keys collide are kept as adjacent records. Opening a
+    bank maps the file and reads only the header, so every process using
+    the same bank shares one page-cached copy, and lookups binary-search
+    the records in place without deserialising the bank. ``--verify
+    --bank`` reads a bank this way from every worker process.
+    """
+
+    MAGIC = b'P2BANK'
+    VERSION = 2
+    HEADER = struct.Struct('<6sHIIQ')  # magic, version, count, record size, heap offset
+    # key, bit mask of the difficulties offering the problem, numeric answer
+    # flag, then (offset, length) of kind, topic, problem, answer, steps,
+    # message and the JSON of any other fields (operands, problem_type) in the heap
+    RECORD = struct.Struct('<IBBxx14I')
+    DIFFICULTIES = ['Easy', 'Medium', 'Hard']
+    FIELDS = ('kind', 'topic', 'problem', 'answer', 'steps', 'message')
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.count, record_size, self.heap_offset = self.HEADER.unpack_from(self._map, 0)
+        if magic != self.MAGIC:
+            raise ValueError(f"{path} is not a problem bank")
+        if version != self.VERSION:
+            raise ValueError(f"{path} is problem bank version {version}, expected {self.VERSION}")
+        if record_size != self.RECORD.size:
+            raise ValueError(f"{path} has {record_size}-byte records, expected {self.RECORD.size}")
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def key_at(self, index):
+        return struct.unpack_from('<I', self._map, self.HEADER.size + index * self.RECORD.size)[0]
+
+    def _string(self, index, field):
+        """One heap string of a record: 0 kind, 1 topic, 2 problem, ..."""
+        offset, length = struct.unpack_from(
+            '<II', self._map, self.HEADER.size + index * self.RECORD.size + 8 + field * 8)
+        return self._map[self.heap_offset + offset:self.heap_offset + offset + length].decode('utf-8')
+
+    def problem(self, index):
+        """Problem dict stored at a record position"""
+        fields = self.RECORD.unpack_from(self._map, self.HEADER.size + index * self.RECORD.size)
+        key, difficulties, numeric = fields[:3]
+        kind, topic, problem, answer, steps, message, extra = (
+            self._map[self.heap_offset + offset:self.heap_offset + offset + length].decode('utf-8')
+            for offset, length in zip(fields[3::2], fields[4::2]))
+        stored = json.loads(extra) if extra else {}
+        stored.update({
+            'kind': kind,
+            'topic': topic,
+            'difficulties': [level for bit, level in enumerate(self.DIFFICULTIES) if difficulties >> bit & 1],
+            'problem': problem,
+            'answer': int(answer) if numeric else answer,
+            'steps': steps.split("\n"),
+            'message': message
+        })
+        return stored
+
+    def find(self, key):
+        """First record position with a RecentProblemIndex key, or None"""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and self.key_at(low) == key:
+            return low
+        return None
+
+    def lookup(self, problem):
+        """Stored copy (with answer and steps) of a problem, or None"""
+        key = RecentProblemIndex.problem_key(problem)
+        index = self.find(key)
+        if index is None:
+            return None
+        # Keys are CRC32s, so check the text of every record sharing the key
+        while index < self.count and self.key_at(index) == key:
+            if (self._string(index, 2) == problem['problem']
+                    and self._string(index, 1) == problem['topic']):
+                return self.problem(index)
+            index += 1
+        return None
+
+    @classmethod
+    def build(cls, path, generator=None, samples_per_kind=500):
+        """Write a bank with every enumerable problem plus random samples of the rest"""
+        generator = generator or RwandanP2ProblemGenerator()
+        # Deduplicated on the text itself; problems with colliding keys are all kept.
+        # Each problem remembers every difficulty it came up at, as a bit mask
+        problems = {}
+
+        def add(problem, difficulty):
+            entry = problems.setdefault((problem['topic'], problem['problem']), [0, problem])
+            entry[0] |= 1 << cls.DIFFICULTIES.index(difficulty)
+
+        for difficulty in cls.DIFFICULTIES:
+            for topic in generator.topics:
+                if topic.space:
+                    space = generator.problem_space(topic.kind, difficulty)
+                    for position in range(len(space)):
+                        add(space.problem(position), difficulty)
+                if topic.space == topic.kind:
+                    continue
+                for _ in range(samples_per_kind):
+                    add(generator.generate(topic.kind, difficulty), difficulty)
+
+        heap = bytearray()
+        heap_offsets = {}
+
+        def add_string(text):
+            if text not in heap_offsets:
+                heap_offsets[text] = len(heap)
+                heap.extend(text.encode('utf-8'))
+            return heap_offsets[text], len(text.encode('utf-8'))
+
+        records = bytearray()
+        for key, difficulties, problem in sorted(
+                ((RecentProblemIndex.problem_key(problem), difficulties, problem)
+                 for difficulties, problem in problems.values()), key=lambda record: record[0]):
+            extra = {name: value for name, value in problem.items() if name not in cls.FIELDS}
+            strings = [problem['kind'], problem['topic'], problem['problem'], str(problem['answer']),
+                       "\n".join(problem['steps']), problem['message'], json.dumps(extra) if extra else ""]
+            pointers = [value for text in strings for value in add_string(text)]
+            records += cls.RECORD.pack(key, difficulties, isinstance(problem['answer'], int), *pointers)
+
+        header = cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(problems), cls.RECORD.size,
+                                 cls.HEADER.size + len(records))
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(header)
+            f.write(records)
+            f.write(heap)
+        os.replace(temp_path, path)
+        return len(problems)
+
+class SyncReplica:
+    """Offline-first replica of every machine's attempt log and the
+    per-student progress derived from them.
+
+    Each machine only ever appends to its own attempt log, so a replica's
+    knowledge is a version vector of byte offsets, one per origin machine.
+    A delta is the tail of each origin log past the peer's offset, which
+    makes merging conflict-free and sync cost proportional to new activity.
+    Progress is kept as grow-only counters per student and machine for
+    ``problems_solved``/``correct_answers`` plus a set union of
+    ``topics_practiced``.
+    """
+
+    STATE_FILE = 'sync_state.json'
+    DEFAULT_PORT = 8765
+    # Machine ids come from peers and name log files, so only these are accepted
+    MACHINE_ID = re.compile(r'[0-9a-f]{12}')
+    MAX_FRAME = 64 * 1024 * 1024  # bytes per frame or delta file, compressed or not
+
+    def __init__(self, directory, own_log=None, machine_id=None, role='machine'):
+        self.directory = directory
+        self.role = role
+        os.makedirs(directory, exist_ok=True)
+        self.state_path = os.path.join(directory, self.STATE_FILE)
+        if os.path.exists(self.state_path):
+            with open(self.state_path, 'r') as f:
+                self.state = json.load(f)
+        else:
+            self.state = {
+                'machine_id': machine_id or uuid.uuid4().hex[:12],
+                'version': {},    # origin machine -> bytes of its log held here
+                'students': {},   # student -> G-counters and topic set
+                'peers': {}       # peer machine -> its version at last sync
+            }
+        self.machine_id = self.check_machine_id(self.state['machine_id'])
+        self.own_log = own_log or os.path.join(directory, f"{self.machine_id}.jsonl")
+
+    @classmethod
+    def check_machine_id(cls, machine):
+        if not isinstance(machine, str) or not cls.MACHINE_ID.fullmatch(machine):
+            raise ValueError(f"Invalid machine id {machine!r}")
+        return machine
+
+    def log_path(self, machine):
+        if machine == self.machine_id:
+            return self.own_log
+        return os.path.join(self.directory, f"{machine}.jsonl")
+
+    def version(self):
+        self.refresh()
+        return dict(self.state['version'])
+
+    def refresh(self):
+        """Fold attempts appended to this machine's own log since the last call"""
+        if not os.path.exists(self.own_log):
+            return
+        offset = self.state['version'].get(self.machine_id, 0)
+        with open(self.own_log, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+        # Only complete lines; an attempt may still be being written
+        data = data[:data.rfind(b"\n") + 1]
+        if data:
+            self._fold(self.machine_id, self.parse_attempts(data))
+            self.state['version'][self.machine_id] = offset + len(data)
+            self.save()
+
+    @staticmethod
+    def parse_attempts(data):
+        """Attempts in complete log lines; raises ValueError if any line is malformed"""
+        if not data.endswith(b"\n"):
+            raise ValueError("Attempt log data does not end with a complete line")
+        attempts = []
+        for line in data.decode('utf-8').splitlines():
+            if not line.strip():
+                continue
+            attempt = json.loads(line)
+            if (not isinstance(attempt, dict) or not isinstance(attempt.get('student'), str)
+                    or not isinstance(attempt.get('topic'), str) or 'correct' not in attempt):
+                raise ValueError(f"Malformed attempt: {line[:80]}")
+            attempts.append(attempt)
+        return attempts
+
+    def _fold(self, machine, attempts):
+        for attempt in attempts:
+            student = self.state['students'].setdefault(attempt['student'], {
+                'problems_solved': {},
+                'correct_answers': {},
+                'topics_practiced': []
+            })
+            solved = student['problems_solved']
+            solved[machine] = solved.get(machine, 0) + 1
+            if attempt['correct']:
+                correct = student['correct_answers']
+                correct[machine] = correct.get(machine, 0) + 1
+            if attempt['topic'] not in student['topics_practiced']:
+                student['topics_practiced'].append(attempt['topic'])
+
+    def delta_since(self, peer_version):
+        """Attempt log tails the peer has not got yet: {machine: [offset, text]}"""
+        delta = {}
+        for machine, size in self.version().items():
+            start = peer_version.get(machine, 0)
+            if start < size:
+                with open(self.log_path(machine), 'rb') as f:
+                    f.seek(start)
+                    delta[machine] = [start, f.read(size - start).decode('utf-8')]
+        return delta
+
+    def apply_delta(self, delta):
+        """Merge a peer's delta; parts already held here are skipped.
+
+        Every part is checked and parsed before anything is written, so a
+        bad delta raises ValueError and leaves the logs as they were.
+        """
+        parts = []
+        for machine, (start, text) in delta.items():
+            self.check_machine_id(machine)
+            if machine == self.machine_id:
+                continue
+            held = self.state['version'].get(machine, 0)
+            if not isinstance(start, int) or start > held:
+                continue  # gap: the peer will resend from our offset next time
+            data = text.encode('utf-8')[held - start:]
+            if data:
+                parts.append((machine, held, data, self.parse_attempts(data)))
+
+        for machine, held, data, attempts in parts:
+            with open(self.log_path(machine), 'ab') as f:
+                f.write(data)
+            self._fold(machine, attempts)
+            self.state['version'][machine] = held + len(data)
+        self.save()
+
+    def student_progress(self, name):
+        """Merged progress for one student across every machine"""
+        student = self.state['students'].get(name)
+        if student is None:
+            return {'problems_solved': 0, 'correct_answers': 0, 'topics_practiced': set()}
+        return {
+            'problems_solved': sum(student['problems_solved'].values()),
+            'correct_answers': sum(student['correct_answers'].values()),
+            'topics_practiced': set(student['topics_practiced'])
+        }
+
+    def merge_progress(self, student_data):
+        """Add attempts other machines made since the last merge to a student's progress.
+
+        ``synced_from`` in the progress remembers how much of each machine's
+        counters has been added, so merging again only adds what is new.
+        Attempts made on this machine are already counted by the tutor.
+        Outside kiosk mode every pupil is called "Student", so that name is
+        never merged: it would lump different children together.
+        """
+        name = student_data.get('student_name')
+        if not name or name == 'Student':
+            return False
+        student = self.state['students'].get(name)
+        if student is None:
+            return False
+        applied = student_data.setdefault('synced_from', {})
+        changed = False
+        for machine, solved in student['problems_solved'].items():
+            if machine == self.machine_id:
+                continue
+            correct = student['correct_answers'].get(machine, 0)
+            applied_solved, applied_correct = applied.get(machine, (0, 0))
+            if (solved, correct) != (applied_solved, applied_correct):
+                student_data['problems_solved'] = student_data.get('problems_solved', 0) + solved - applied_solved
+                student_data['correct_answers'] = student_data.get('correct_answers', 0) + correct - applied_correct
+                applied[machine] = [solved, correct]
+                changed = True
+        topics = set(student_data.get('topics_practiced', [])) | set(student['topics_practiced'])
+        changed = changed or len(topics) != len(student_data.get('topics_practiced', []))
+        student_data['topics_practiced'] = topics
+        return changed
+
+    def update_progress_files(self, paths):
+        """Merge synced progress into the tutor's saved progress files; returns how many changed"""
+        updated = 0
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+                if self.merge_progress(data):
+                    data['topics_practiced'] = sorted(data['topics_practiced'])
+                    with open(path, 'w') as f:
+                        json.dump(data, f)
+                    updated += 1
+            except Exception as e:
+                print(f"Could not merge progress into {path}: {e}")
+        return updated
+
+    def save(self):
+        temp_path = self.state_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(self.state, f)
+        os.replace(temp_path, self.state_path)
+
+    # USB stick exchange: a compressed delta file addressed to one peer
+
+    def export_delta(self, path, peer=None):
+        """Write everything ``peer`` (default: the hub) lacked at its last sync to ``path``"""
+        peer = peer or self.state.get('hub_id')
+        package = {
+            'machine': self.machine_id,
+            'role': self.role,
+            'version': self.version(),
+            'delta': self.delta_since(self.state['peers'].get(peer, {}))
+        }
+        with open(path, 'wb') as f:
+            f.write(zlib.compress(json.dumps(package).encode('utf-8')))
+
+    def import_delta(self, path):
+        """Merge a delta file and remember what its sender holds; returns the sender"""
+        with open(path, 'rb') as f:
+            package = self.decompress(f.read(self.MAX_FRAME + 1))
+        self.check_machine_id(package['machine'])
+        self.apply_delta(package['delta'])
+        self.remember_peer(package['machine'], package['version'])
+        if package['role'] == 'hub':
+            self.state['hub_id'] = package['machine']
+            self.save()
+        return package['machine']
+
+    def remember_peer(self, peer, peer_version):
+        """Record that ``peer`` holds at least ``peer_version``"""
+        known = self.state['peers'].setdefault(self.check_machine_id(peer), {})
+        for machine, size in peer_version.items():
+            self.check_machine_id(machine)
+            known[machine] = max(known.get(machine, 0), size)
+        self.save()
+
+    # LAN exchange with a SyncHub
+
+    @staticmethod
+    def write_frame(stream, message):
+        payload = zlib.compress(json.dumps(message).encode('utf-8'))
+        stream.write(struct.pack('>I', len(payload)) + payload)
+        stream.flush()
+
+    @classmethod
+    def decompress(cls, payload):
+        """JSON message from a compressed frame or delta file, refusing oversized ones"""
+        if len(payload) > cls.MAX_FRAME:
+            raise ValueError("Sync message too large")
+        decompressor = zlib.decompressobj()
+        text = decompressor.decompress(payload, cls.MAX_FRAME)
+        if decompressor.unconsumed_tail:
+            raise ValueError("Sync message too large")
+        return json.loads(text)
+
+    @classmethod
+    def read_frame(cls, stream):
+        header = stream.read(4)
+        if len(header) < 4:
+            raise ConnectionError("Sync connection closed early")
+        length = struct.unpack('>I', header)[0]
+        if length > cls.MAX_FRAME:
+            raise ValueError("Sync frame too large")
+        payload = stream.read(length)
+        if len(payload) < length:
+            raise ConnectionError("Sync connection closed early")
+        return cls.decompress(payload)
+
+    def sync_with_hub(self, host, port=DEFAULT_PORT, timeout=30):
+        """Two-way sync with a hub; returns the hub's machine id"""
+        with socket.create_connection((host, port), timeout=timeout) as sock:
+            stream = sock.makefile('rwb')
+            self.write_frame(stream, {'machine': self.machine_id, 'version': self.version()})
+            reply = self.read_frame(stream)
+            self.apply_delta(reply['delta'])
+            sent_version = self.version()
+            self.write_frame(stream, {'delta': self.delta_since(reply['version'])})
+            self.read_frame(stream)  # hub acknowledges once merged
+        self.remember_peer(reply['machine'], reply['version'])
+        self.remember_peer(reply['machine'], sent_version)
+        self.state['hub_id'] = reply['machine']
+        self.save()
+        return reply['machine']
+
+
+class SyncHub(socketserver.ThreadingTCPServer):
+    """School hub that classroom machines sync with over the LAN"""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, replica, address=('0.0.0.0', SyncReplica.DEFAULT_PORT)):
+        super().__init__(address, SyncRequestHandler)
+        self.replica = replica
+        self.lock = threading.Lock()
+
+
+class SyncRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        replica = self.server.replica
+        request = SyncReplica.read_frame(self.rfile)
+        SyncReplica.check_machine_id(request['machine'])
+        with self.server.lock:
+            version = replica.version()
+            delta = replica.delta_since(request['version'])
+        SyncReplica.write_frame(self.wfile, {'machine': replica.machine_id,
+                                             'version': version, 'delta': delta})
+
+        reply = SyncReplica.read_frame(self.rfile)
+        with self.server.lock:
+            replica.apply_delta(reply['delta'])
+            replica.remember_peer(request['machine'], request['version'])
+            replica.remember_peer(request['machine'], version)
+        SyncReplica.write_frame(self.wfile, {'ok': True})
+
+class ClassroomSimulator:
+    """Drives virtual pupils through the real tutor loop to measure load.
+
+    Each pupil is a HeadlessTutor with its own progress file, running as an
+    asyncio task: pose a problem, think, maybe ask for hints, answer and
+    save. Pupils are split across worker processes, and the report gives
+    throughput, latency percentiles per step and how much storage grew.
+    """
+
+    STEPS = ['pose_problem', 'get_hint', 'check_answer']
+
+    def __init__(self, pupils=30, problems_per_pupil=20, accuracy=0.7, accuracy_spread=0.15,
+                 hint_rate=0.3, think_time=20.0, time_scale=0.001, processes=1,
+                 difficulty='Easy', directory='rwanda_p2_simulation', seed=None):
+        self.pupils = pupils
+        self.problems_per_pupil = problems_per_pupil
+        self.accuracy = accuracy              # mean chance a pupil answers correctly
+        self.accuracy_spread = accuracy_spread  # spread of that chance between pupils
+        self.hint_rate = hint_rate            # chance of asking for (another) hint
+        self.think_time = think_time          # median seconds spent on a problem
+        self.time_scale = time_scale          # simulated seconds -> real seconds
+        self.processes = processes
+        self.difficulty = difficulty
+        self.directory = directory
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+
+    def run(self):
+        os.makedirs(self.directory, exist_ok=True)
+        size_before = self._storage_size()
+        workers = max(1, min(self.processes, self.pupils))
+        groups = [list(range(worker, self.pupils, workers)) for worker in range(workers)]
+
+        started = time.perf_counter()
+        if workers == 1:
+            results = [self._run_worker(groups[0], 0)]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self._run_worker, groups, range(workers)))
+        elapsed = time.perf_counter() - started
+
+        latencies = {step: [] for step in self.STEPS}
+        for result in results:
+            for step in self.STEPS:
+                latencies[step].extend(result[step])
+        answered = len(latencies['check_answer'])
+        storage_growth = self._storage_size() - size_before
+        return {
+            'pupils': self.pupils,
+            'processes': workers,
+            'elapsed_seconds': elapsed,
+            'problems_answered': answered,
+            'throughput_per_second': answered / elapsed if elapsed else 0.0,
+            'latency_ms': {step: self._percentiles(values) for step, values in latencies.items()},
+            'storage_growth_bytes': storage_growth,
+            'bytes_per_answer': storage_growth / answered if answered else 0.0
+        }
+
+    def _run_worker(self, pupil_ids, worker):
+        return asyncio.run(self._run_pupils(pupil_ids, worker))
+
+    async def _run_pupils(self, pupil_ids, worker):
+        latencies = {step: [] for step in self.STEPS}
+        attempt_log = os.path.join(self.directory, f"attempts_worker{worker}.jsonl")
+        await asyncio.gather(*(self._run_pupil(pupil_id, attempt_log, latencies)
+                               for pupil_id in pupil_ids))
+        return latencies
+
+    async def _run_pupil(self, pupil_id, attempt_log, latencies):
+        rng = random.Random(self.seed + pupil_id)
+        tutor = HeadlessTutor(os.path.join(self.directory, f"pupil{pupil_id}.json"),
+                              attempt_log, f"Pupil {pupil_id}", random.Random(rng.random()))
+        tutor.student_data['difficulty_level'] = self.difficulty
+        accuracy = min(1.0, max(0.0, rng.gauss(self.accuracy, self.accuracy_spread)))
+
+        for _ in range(self.problems_per_pupil):
+            kind = rng.choice(tutor.generator.topics.kinds())
+            started = time.perf_counter()
+            tutor.pose_problem(kind)
+            latencies['pose_problem'].append(time.perf_counter() - started)
+
+            # Think times are log-normal around the median
+            await asyncio.sleep(self.think_time * rng.lognormvariate(0, 0.5) * self.time_scale)
+
+            while rng.random() < self.hint_rate and tutor.hint_count < len(tutor.current_steps):
+                started = time.perf_counter()
+                tutor.get_hint()
+                latencies['get_hint'].append(time.perf_counter() - started)
+
+            answer = tutor.current_answer
+            if rng.random() >= accuracy:
+                answer = answer + 1 if isinstance(answer, int) else f"not {answer}"
+            tutor.answer_entry.insert(0, str(answer))
+            started = time.perf_counter()
+            tutor.check_answer()
+            latencies['check_answer'].append(time.perf_counter() - started)
+
+    def _storage_size(self):
+        return sum(entry.stat().st_size for entry in os.scandir(self.directory) if entry.is_file())
+
+    @staticmethod
+    def _percentiles(values):
+        if not values:
+            return {}
+        values = sorted(values)
+        return {name: values[min(len(values) - 1, int(len(values) * share))] * 1000
+                for name, share in (('p50', 0.5), ('p95', 0.95), ('p99', 0.99), ('max', 1.0))}
+
+    @staticmethod
+    def format_report(report):
+        lines = [
+            f"Pupils: {report['pupils']} in {report['processes']} process(es)",
+            f"Answered: {report['problems_answered']} problems in {report['elapsed_seconds']:.1f} s "
+            f"({report['throughput_per_second']:.1f} per second)"
+        ]
+        for step, percentiles in report['latency_ms'].items():
+            if percentiles:
+                lines.append(f"  {step}: " + ", ".join(f"{name} {value:.2f} ms"
+                                                      for name, value in percentiles.items()))
+        lines.append(f"Storage growth: {report['storage_growth_bytes']} bytes "
+                     f"({report['bytes_per_answer']:.0f} bytes per answer)")
+        return "\n".join(lines)
+
+class GeneratorVerifier:
+    """Property-based checks of every problem generator, run in a process pool.
+
+    Every kind is generated at every difficulty from its own seed, and each
+    problem is checked against invariants: all fields filled in, numbers in
+    the answer within the P2 range, the answer stated in the final step,
+    sums and quotients that work out, and no exceptions (such as randint
+    being handed an empty range). Across the whole run, every outcome label
+    a question offers (">", "km", "certain", ...) must be the answer at least
+    once for that kind and problem type. With ``bank``, the problems of a
+    ProblemBank file are checked instead, every worker process mapping the
+    same file, and each must also be found again by ``lookup``.
+    """
+
+    DIFFICULTIES = ['Easy', 'Medium', 'Hard']
+    EXPRESSION = re.compile(r'(\d+) ([+\-×÷]) (\d+)')
+    EXAMPLES = 3  # examples kept per failed invariant
+
+    def __init__(self, samples=1000000, processes=1, chunk_size=20000, seed=None, bank=None):
+        self.samples = samples
+        self.processes = processes
+        self.chunk_size = chunk_size
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.bank = bank  # path of a ProblemBank to check instead of the generators
+
+    def chunks(self):
+        """(kind, difficulty, count, seed) work items covering ``samples`` problems"""
+        combinations = list(itertools.product(TopicRegistry.shared().kinds(), self.DIFFICULTIES))
+        per_combination = max(1, self.samples // len(combinations))
+        chunks = []
+        for kind, difficulty in combinations:
+            for start in range(0, per_combination, self.chunk_size):
+                count = min(self.chunk_size, per_combination - start)
+                chunks.append((kind, difficulty, count, self.seed + len(chunks)))
+        return chunks
+
+    def bank_chunks(self):
+        """(start, stop) record ranges covering the bank"""
+        bank = ProblemBank(self.bank)
+        count = len(bank)
+        bank.close()
+        return [(start, min(start + self.chunk_size, count)) for start in range(0, count, self.chunk_size)]
+
+    def run(self):
+        if self.bank:
+            chunks, verify = self.bank_chunks(), self._verify_bank_chunk
+        else:
+            chunks, verify = self.chunks(), self._verify_chunk
+        workers = max(1, min(self.processes, len(chunks)))
+
+        started = time.perf_counter()
+        if workers == 1:
+            results = [verify(*chunk) for chunk in chunks]
+        elif chunks:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(verify, *zip(*chunks)))
+        else:
+            results = []
+        elapsed = time.perf_counter() - started
+
+        failures = {}
+        offered = {}
+        answered = {}
+        for result in results:
+            for invariant, (count, examples) in result['failures'].items():
+                total = failures.setdefault(invariant, {'count': 0, 'examples': []})
+                total['count'] += count
+                total['examples'].extend(examples[:self.EXAMPLES - len(total['examples'])])
+            for branch, labels in result['offered'].items():
+                offered.setdefault(branch, set()).update(labels)
+            for branch, labels in result['answered'].items():
+                answered.setdefault(branch, set()).update(labels)
+
+        unreachable = {branch: sorted(labels - answered.get(branch, set()))
+                       for branch, labels in offered.items()}
+        unreachable = {branch: labels for branch, labels in unreachable.items() if labels}
+        checked = sum(result['checked'] for result in results)
+        return {
+            'checked': checked,
+            'processes': workers,
+            'elapsed_seconds': elapsed,
+            'problems_per_second': checked / elapsed if elapsed else 0.0,
+            'failures': failures,
+            'unreachable': unreachable,
+            'passed': not failures and not unreachable
+        }
+
+    def _verify_chunk(self, kind, difficulty, count, seed):
+        generator = RwandanP2ProblemGenerator(random.Random(seed))
+        labels = self._labels(kind)
+        result = {'checked': 0, 'failures': {}, 'offered': {}, 'answered': {}}
+        for _ in range(count):
+            try:
+                problem = generator.generate(kind, difficulty)
+                failed = self.check(problem)
+            except Exception as error:  # a crash is a failure like any other
+                problem = {'kind': kind, 'problem': repr(error)}
+                failed = ['exception']
+            self._tally(result, kind, difficulty, problem, failed, labels)
+        return result
+
+    def _verify_bank_chunk(self, start, stop):
+        bank = ProblemBank(self.bank)
+        topics = TopicRegistry.shared()
+        labels = {}
+        result = {'checked': 0, 'failures': {}, 'offered': {}, 'answered': {}}
+        try:
+            for index in range(start, stop):
+                try:
+                    problem = bank.problem(index)
+                    kind = problem['kind']
+                    if kind not in topics:
+                        failed = ['unknown_kind']
+                    else:
+                        failed = self.check(problem)
+                        if not problem['difficulties']:
+                            failed.append('no_difficulty')
+                        if bank.lookup(problem) != problem:
+                            failed.append('lookup')
+                except Exception as error:
+                    kind, problem, failed = 'bank', {'problem': repr(error)}, ['exception']
+                if kind not in labels:
+                    labels[kind] = self._labels(kind) if kind in topics else {}
+                self._tally(result, kind, '/'.join(problem.get('difficulties', [])),
+                            problem, failed, labels[kind])
+        finally:
+            bank.close()
+        return result
+
+    @staticmethod
+    def _labels(kind):
+        """Patterns finding each of a topic's ``OPTIONS`` in a question"""
+        return {label: re.compile(r'(?<!\w)' + re.escape(label) + r'(?!\w)')
+                for label in TopicRegistry.shared()[kind].options}
+
+    def _tally(self, result, kind, difficulty, problem, failed, labels):
+        """Add one checked problem to a chunk's result"""
+        result['checked'] += 1
+        answer = str(problem.get('answer'))
+        if answer in labels:
+            # Labels the question itself lists are the ones pupils may pick from
+            branch = '/'.join(filter(None, (kind, problem.get('problem_type'))))
+            result['offered'].setdefault(branch, set()).update(
+                label for label, pattern in labels.items() if pattern.search(problem['problem']))
+            result['answered'].setdefault(branch, set()).add(answer)
+        for invariant in failed:
+            entry = result['failures'].setdefault(f"{kind}/{invariant}", [0, []])
+            entry[0] += 1
+            if len(entry[1]) < self.EXAMPLES:
+                entry[1].append(f"{difficulty}: {problem.get('problem')} -> {problem.get('answer')!r}")
+
+    @classmethod
+    def check(cls, problem):
+        """Names of the invariants ``problem`` breaks (empty when it is fine)"""
+        failed = []
+        answer = str(problem.get('answer', ''))
+        steps = problem.get('steps') or []
+        if not (problem.get('topic') and problem.get('problem') and problem.get('message')
+                and answer and steps and all(steps)):
+            failed.append('missing_fields')
+
+        limit = TopicRegistry.shared()[problem['kind']].answer_limit
+        if any(int(number) > limit for number in re.findall(r'\d+', answer)):
+            failed.append('answer_range')
+
+        if steps and not re.search(r'(?<!\w)' + re.escape(answer) + r'(?!\w)', steps[-1], re.IGNORECASE):
+            failed.append('answer_not_in_steps')
+
+        expression = cls.EXPRESSION.fullmatch(problem.get('problem', ''))
+        if expression:
+            a, operator, b = int(expression.group(1)), expression.group(2), int(expression.group(3))
+            if operator == '÷' and (b == 0 or a % b):
+                failed.append('inexact_division')
+            else:
+                expected = {'+': a + b, '-': a - b, '×': a * b, '÷': a // b if b else None}[operator]
+                if expected is None or expected < 0 or answer != str(expected):
+                    failed.append('wrong_answer')
+        return failed
+
+    @staticmethod
+    def format_report(report):
+        lines = [f"Checked {report['checked']} problems in {report['processes']} process(es) in "
+                 f"{report['elapsed_seconds']:.1f} s ({report['problems_per_second']:.0f} per second)"]
+        for invariant, failure in sorted(report['failures'].items()):
+            lines.append(f"  FAIL {invariant}: {failure['count']} problem(s)")
+            lines.extend(f"    {example}" for example in failure['examples'])
+        for branch, labels in sorted(report['unreachable'].items()):
+            lines.append(f"  FAIL {branch}/unreachable: never answered {', '.join(labels)}")
+        lines.append("All invariants hold" if report['passed'] else "Verification failed")
+        return "\n".join(lines)
+
+# Additional utility functions for P2 curriculum
+class RwandanP2MathUtils:
+    @staticmethod
+    def is_valid_p2_number(num):
+        """Check if number is within P2 range (0-999)"""
+        return 0 <= num <= 999
+
+    @staticmethod
+    def convert_to_rwandan_francs(amount):
+        """Format amount as Rwandan Francs"""
+        return f"{amount} Rwf"
+
+    @staticmethod
+    def get_shape_properties(shape):
+        """Get properties of geometric shapes for P2 level"""
+        properties = {
+            'square': {'sides': 4, 'angles': 4, 'equal_sides': True},
+            'rectangle': {'sides': 4, 'angles': 4, 'equal_sides': False},
+            'triangle': {'sides': 3, 'angles': 3, 'equal_sides': False},
+            'circle': {'sides': 0, 'angles': 0, 'equal_sides': False}
+        }
+        return properties.get(shape, {})
+
+    @staticmethod
+    def metric_conversion_factor(from_unit, to_unit):
+        """Get conversion factors for metric units"""
+        conversions = {
+            ('m', 'cm'): 100,
+            ('cm', 'm'): 0.01,
+            ('l', 'ml'): 1000,
+            ('ml', 'l'): 0.001,
+            ('kg', 'g'): 1000,
+            ('g', 'kg'): 0.001
+        }
+        return conversions.get((from_unit, to_unit), 1)
+
+# Main execution
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rwandan P2 Math Tutor")
+    parser.add_argument('--hub', action='store_true',
+                        help="run the school sync hub instead of the tutor")
+    parser.add_argument('--sync', metavar='HOST',
+                        help="sync this machine's attempts with the hub at HOST and exit")
+    parser.add_argument('--export-delta', metavar='PATH',
+                        help="write attempts the hub lacks to PATH (e.g. a USB stick) and exit")
+    parser.add_argument('--import-delta', metavar='PATH',
+                        help="merge a delta file from PATH and exit")
+    parser.add_argument('--port', type=int, default=SyncReplica.DEFAULT_PORT)
+    parser.add_argument('--build-bank', metavar='PATH',
+                        help="write a memory-mapped problem bank to PATH and exit")
+    parser.add_argument('--simulate', type=int, metavar='PUPILS',
+                        help="run a headless virtual-classroom load test and exit")
+    parser.add_argument('--verify', type=int, metavar='SAMPLES',
+                        help="check SAMPLES generated problems against invariants and exit")
+    parser.add_argument('--verify-bank', metavar='PATH',
+                        help="check every problem in the bank at PATH against the same invariants and exit")
+    parser.add_argument('--processes', type=int,
+                        help="worker processes for --simulate (default 1) and --verify and --verify-bank "
+                             "(default all cores)")
+    parser.add_argument('--kiosk', action='store_true',
+                        help="shared computer: pupils pick their name and take turns")
+    parser.add_argument('--class', dest='class_name', metavar='NAME',
+                        help="put the pupils on this computer in class NAME for teacher reports")
+    parser.add_argument('--worksheets', metavar='KINDS',
+                        help="write printable worksheets for comma-separated problem kinds and exit")
+    parser.add_argument('--pages', type=int, default=1,
+                        help="worksheet pages to write (default 1)")
+    parser.add_argument('--difficulty', choices=['Easy', 'Medium', 'Hard'], default='Easy',
+                        help="worksheet difficulty (default Easy)")
+    parser.add_argument('--multiple-choice', action='store_true',
+                        help="print answer choices under each worksheet problem")
+    parser.add_argument('--report', action='store_true',
+                        help="update the class analytics from the attempt log, print the report and exit")
+    args = parser.parse_args()
+
+    if args.simulate:
+        simulator = ClassroomSimulator(pupils=args.simulate, processes=args.processes or 1)
+        print(ClassroomSimulator.format_report(simulator.run()))
+        sys.exit()
+
+    if args.verify or args.verify_bank:
+        verifier = GeneratorVerifier(samples=args.verify, processes=args.processes or os.cpu_count(),
+                                     bank=args.verify_bank)
+        report = verifier.run()
+        print(GeneratorVerifier.format_report(report))
+        sys.exit(0 if report['passed'] else 1)
+
+    if args.worksheets:
+        kinds = [kind.strip() for kind in args.worksheets.split(',') if kind.strip()]
+        unknown = [kind for kind in kinds if kind not in TopicRegistry.shared().kinds()]
+        if unknown or not kinds:
+            parser.error(f"unknown problem kinds {', '.join(unknown)}; "
+                         f"choose from {', '.join(TopicRegistry.shared().kinds())}")
+        renderer = WorksheetRenderer(multiple_choice=args.multiple_choice)
+        renderer.render_files(WorksheetRenderer.WORKSHEET_FILE, WorksheetRenderer.ANSWER_KEY_FILE,
+                              kinds, args.difficulty, args.pages)
+        print(f"📝 Wrote {args.pages} page(s) to {WorksheetRenderer.WORKSHEET_FILE} "
+              f"and the answers to {WorksheetRenderer.ANSWER_KEY_FILE}")
+        sys.exit()
+
+    if args.report:
+        analytics = ClassAnalytics.load(RwandanP2MathTutor.ANALYTICS_FILE)
+        analytics.update_from_log(RwandanP2MathTutor.ATTEMPT_LOG_FILE)
+        analytics.save(RwandanP2MathTutor.ANALYTICS_FILE)
+        classes = [args.class_name] if args.class_name else analytics.classes()
+        pupils = ClassAnalytics.load_pupils([RwandanP2MathTutor.PROGRESS_FILE,
+                                             *RwandanP2MathTutor.profile_files().values()])
+        generator = RwandanP2ProblemGenerator()
+        print("\n\n".join(analytics.report(name, pupils, generator) for name in classes)
+              or "No attempts logged yet")
+        sys.exit()
+
+    if args.build_bank:
+        print(f"🏦 Wrote {ProblemBank.build(args.build_bank)} problems to {args.build_bank}")
+        sys.exit()
+
+    if args.sync or args.export_delta or args.import_delta:
+        if args.hub:
+            replica = SyncReplica('rwanda_p2_sync_hub', role='hub')
+        else:
+            replica = SyncReplica('rwanda_p2_sync', own_log=RwandanP2MathTutor.ATTEMPT_LOG_FILE)
+
+        # On the hub, a USB delta is answered with one for the machine it came from
+        peer = None
+        if args.import_delta:
+            peer = replica.import_delta(args.import_delta)
+            print(f"🔄 Merged delta from {peer}")
+        if args.sync:
+            print(f"🔄 Synced with hub {replica.sync_with_hub(args.sync, args.port)}")
+        if args.export_delta:
+            replica.export_delta(args.export_delta, peer)
+            print(f"🔄 Delta written to {args.export_delta}")
+
+        if not args.hub and (args.sync or args.import_delta):
+            # Show named kiosk pupils their attempts from every machine
+            profile_dir = RwandanP2MathTutor.PROFILE_DIR
+            paths = []
+            if os.path.isdir(profile_dir):
+                paths = [os.path.join(profile_dir, name)
+                         for name in sorted(os.listdir(profile_dir)) if name.endswith('.json')]
+            print(f"🔄 Updated progress for {replica.update_progress_files(paths)} pupil(s)")
+        sys.exit()
+
+    if args.hub:
+        hub = SyncHub(SyncReplica('rwanda_p2_sync_hub', role='hub'), ('0.0.0.0', args.port))
+        print(f"🔄 Sync hub listening on port {args.port}")
+        hub.serve_forever()
+        sys.exit()
+
+    if tk is None:
+        sys.exit("❌ The tutor window needs tkinter (python3-tk), which is not installed")
+
+    print("🇷🇼 Starting Rwandan P2 Math Tutor System...")
+    print("📚 Based on Republic of Rwanda Primary Two Curriculum:")
+    print("   ✅ Numeration and Operations (0-999)")
+    print("   ✅ Number comparison")
+    print("   ✅ Addition and Subtraction (up to 999)")
+    print("   ✅ Multiplication and Division")
+    print("   ✅ Metric Systems (Length, Capacity, Mass)")
+    print("   ✅ Unit Conversions")
+    print("   ✅ Geometric Figures (Squares, Rectangles, Triangles)")
+    print("   ✅ Perimeter Calculations")
+    print("   ✅ Probability Concepts")
+    print("   ✅ Contextual Word Problems")
+    print("\n🎯 Perfectly aligned with Rwandan Primary Education Standards!")
+    print("🌟 Features Kinyarwanda greetings and local context")
+
+    # Create and run the tutor
+    tutor = RwandanP2MathTutor(kiosk=args.kiosk, class_name=args.class_name)
+    tutor.run()
@@ -0,0 +1,5 @@
+"""The P2 curriculum topics, one module per topic.
+
+See TopicRegistry in P2.py for what a topic module provides. Modules whose
+names start with an underscore hold code shared between topics.
+"""
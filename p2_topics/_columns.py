@@ -0,0 +1,85 @@
+"""Column addition and subtraction shared by the addition and subtraction topics"""
+
+
+class ColumnSolver:
+    """Digit-by-digit column addition and subtraction with carry/borrow traces.
+
+    Each pass works on one place value across a whole list of (a, b) pairs, so
+    solving a page of sums takes four passes rather than one per problem.
+    """
+
+    PLACES = ('ones', 'tens', 'hundreds', 'thousands')
+
+    @classmethod
+    def add_columns(cls, pairs):
+        """Per-pair tuples of (top, bottom, carry_in, digit, carry_out), ones place first"""
+        carries = [0] * len(pairs)
+        columns = []
+        for place in (1, 10, 100, 1000):
+            tops = [(a // place) % 10 for a, _ in pairs]
+            bottoms = [(b // place) % 10 for _, b in pairs]
+            totals = [top + bottom + carry for top, bottom, carry in zip(tops, bottoms, carries)]
+            carry_outs = [total // 10 for total in totals]
+            columns.append(list(zip(tops, bottoms, carries, [total % 10 for total in totals], carry_outs)))
+            carries = carry_outs
+        return list(zip(*columns)) if pairs else []
+
+    @classmethod
+    def subtract_columns(cls, pairs):
+        """Per-pair tuples of (top, bottom, borrow_in, digit, borrow_out), ones place first"""
+        borrows = [0] * len(pairs)
+        columns = []
+        for place in (1, 10, 100, 1000):
+            tops = [(a // place) % 10 for a, _ in pairs]
+            bottoms = [(b // place) % 10 for _, b in pairs]
+            differences = [top - borrow - bottom for top, bottom, borrow in zip(tops, bottoms, borrows)]
+            borrow_outs = [int(difference < 0) for difference in differences]
+            columns.append(list(zip(tops, bottoms, borrows,
+                                    [difference % 10 for difference in differences], borrow_outs)))
+            borrows = borrow_outs
+        return list(zip(*columns)) if pairs else []
+
+    @classmethod
+    def addition_steps(cls, pairs):
+        """Worked column-addition steps for each (a, b) pair"""
+        all_steps = []
+        for (a, b), trace in zip(pairs, cls.add_columns(pairs)):
+            steps = [f"We need to add {a} + {b}",
+                     "Let's use column addition, starting with the ones place"]
+            for position, (top, bottom, carry, digit, carry_out) in enumerate(trace[:len(str(a + b))]):
+                carried = " + 1 (carried)" if carry else ""
+                step = f"{cls.PLACES[position].capitalize()} place: {top} + {bottom}{carried} = {top + bottom + carry}"
+                if carry_out:
+                    step += f", write {digit} and carry 1 to the {cls.PLACES[position + 1]}"
+                else:
+                    step += f", write {digit}"
+                steps.append(step)
+            steps.append(f"Result: {a} + {b} = {a + b}")
+            all_steps.append(steps)
+        return all_steps
+
+    @classmethod
+    def subtraction_steps(cls, pairs):
+        """Worked column-subtraction steps for each (a, b) pair"""
+        all_steps = []
+        for (a, b), trace in zip(pairs, cls.subtract_columns(pairs)):
+            steps = [f"We need to subtract {b} from {a}",
+                     "Let's use column subtraction, starting with the ones place"]
+            for position, (top, bottom, borrow, digit, borrow_out) in enumerate(trace[:len(str(a))]):
+                step = f"{cls.PLACES[position].capitalize()} place: "
+                if borrow and not top:
+                    step += (f"0 cannot lend 1 to the {cls.PLACES[position - 1]}, so borrow 1 from the "
+                             f"{cls.PLACES[position + 1]} first: 10 - 1 = 9, then 9 - {bottom} = {digit}")
+                    steps.append(step)
+                    continue
+                if borrow:
+                    step += f"{top} is now {top - 1} after lending 1, "
+                if borrow_out:
+                    step += (f"{top - borrow} is smaller than {bottom}, so borrow 1 from the "
+                             f"{cls.PLACES[position + 1]}: {top - borrow + 10} - {bottom} = {digit}")
+                else:
+                    step += f"{top - borrow} - {bottom} = {digit}"
+                steps.append(step)
+            steps.append(f"Result: {a} - {b} = {a - b}")
+            all_steps.append(steps)
+        return all_steps
@@ -0,0 +1,49 @@
+"""Addition (up to 999)
+
+Column addition with carrying, with sums up to 999.
+"""
+
+from p2_topics._columns import ColumnSolver
+
+
+def generate(generator, difficulty):
+    """Addition up to 999"""
+    return generate_batch(generator, difficulty, 1)[0]
+
+
+def generate_batch(generator, difficulty, count):
+    """Several additions, with all their columns worked in one ColumnSolver pass"""
+    rng = generator.rng
+    min_val, max_val = generator.get_p2_number_range(difficulty)
+    pairs = []
+    for _ in range(count):
+        a = rng.randint(min_val, min(max_val, 999 - min_val))  # Leave room for b
+        b = rng.randint(min_val, min(max_val, 999 - a))  # Ensure sum ≤ 999
+        pairs.append((a, b))
+    return [build_problem(a, b, steps) for (a, b), steps in zip(pairs, ColumnSolver.addition_steps(pairs))]
+
+
+def build_problem(a, b, steps):
+    problem = f"{a} + {b}"
+    answer = a + b
+
+    return {
+        'topic': 'Addition up to 999',
+        'problem': problem,
+        'answer': answer,
+        'steps': steps,
+        'message': f"➕ Addition Problem (up to 999):\n{problem} = ?",
+        'operands': (a, b)
+    }
+
+
+def distractors(problems):
+    """The sum with every carry forgotten, for the whole list at once"""
+    wrong = iter(forgotten_carry([problem['operands'] for problem in problems if 'operands' in problem]))
+    return [[next(wrong)] if 'operands' in problem else [] for problem in problems]
+
+
+def forgotten_carry(pairs):
+    """Column sums with every carry dropped, for (a, b) pairs"""
+    return [sum(((a // place) % 10 + (b // place) % 10) % 10 * place for place in (1, 10, 100))
+            for a, b in pairs]
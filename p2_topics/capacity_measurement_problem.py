@@ -0,0 +1,44 @@
+"""Measuring Capacity
+
+Choosing between millilitres and litres for everyday containers.
+"""
+
+CONTAINERS = ['cup', 'bottle', 'bucket', 'tank', 'spoon']
+# Answers multiple choice picks from
+OPTIONS = ['ml', 'l']
+
+
+def generate(generator, difficulty):
+    """Measuring capacity - metric system"""
+    rng = generator.rng
+    container = rng.choice(CONTAINERS)
+    return build_problem(container)
+
+
+def build_problem(container):
+    if container in ['spoon', 'cup', 'bottle']:
+        unit = 'ml'
+    else:
+        unit = 'l'
+
+    problem = f"What is the most appropriate unit to measure the capacity of a {container}? (ml or l)"
+    answer = unit
+    steps = [
+        f"We need to choose the best unit for measuring a {container}'s capacity",
+        f"Milliliters (ml) for small amounts",
+        f"Liters (l) for larger amounts",
+        f"Best unit for {container}: {unit}"
+    ]
+
+    return {
+        'topic': 'Capacity Measurement',
+        'problem': problem,
+        'answer': answer,
+        'steps': steps,
+        'message': f"🥤 Capacity Measurement Problem:\n{problem}"
+    }
+
+
+def enumerate_params():
+    """build_problem arguments of every problem of this topic, in a fixed order"""
+    return [(container,) for container in CONTAINERS]
@@ -0,0 +1,64 @@
+"""Comparing Numbers
+
+Which of two numbers is greater or less, and the >, < and = symbols.
+"""
+
+import re
+
+# Answers multiple choice picks from for the symbol questions
+OPTIONS = ['>', '<', '=']
+
+
+def generate(generator, difficulty):
+    """Comparing numbers less than 1000"""
+    rng = generator.rng
+    min_val, max_val = generator.get_p2_number_range(difficulty)
+    a = rng.randint(min_val, max_val)
+    b = rng.randint(min_val, max_val)
+
+    # Ensure they're different
+    while a == b:
+        b = rng.randint(min_val, max_val)
+
+    comparison_type = rng.choice(['greater', 'less', 'equal', 'symbol'])
+    if comparison_type == 'equal':
+        # An equal pair in the symbol question; otherwise "=" is never the answer
+        b = a
+        comparison_type = 'symbol'
+
+    if comparison_type == 'greater':
+        problem = f"Which number is greater: {a} or {b}?"
+        answer = str(max(a, b))
+    elif comparison_type == 'less':
+        problem = f"Which number is less: {a} or {b}?"
+        answer = str(min(a, b))
+    else:  # symbol
+        problem = f"Compare these numbers using >, < or =: {a} __ {b}"
+        if a > b:
+            answer = ">"
+        elif a < b:
+            answer = "<"
+        else:
+            answer = "="
+
+    steps = [
+        f"We need to compare {a} and {b}",
+        f"Let's look at the place values",
+        f"Comparing digit by digit from left to right",
+        f"Result: {a} {'>' if a > b else '<' if a < b else '='} {b}"
+    ]
+
+    return {
+        'topic': 'Comparing Numbers',
+        'problem': problem,
+        'answer': answer,
+        'steps': steps,
+        'message': f"⚖️ Number Comparison Problem:\n{problem}",
+        'problem_type': comparison_type
+    }
+
+
+def distractors(problems):
+    """The other number, the usual slip when picking the greater or less one"""
+    return [re.findall(r'\d+', problem['problem']) if str(problem['answer']).isdigit() else []
+            for problem in problems]
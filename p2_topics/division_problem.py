@@ -0,0 +1,49 @@
+"""Division
+
+Division facts with no remainder, the inverse of the multiplication facts.
+"""
+
+# Operand ranges per difficulty: (divisor, quotient)
+RANGES = {
+    'Easy': ((2, 5), (1, 10)),
+    'Medium': ((2, 10), (2, 15)),
+    'Hard': ((3, 12), (3, 20))
+}
+# The facts on offer change with the difficulty
+SPACE_BY_DIFFICULTY = True
+# Pupils' accuracy is counted per fact for the teacher's report
+FACTS = True
+
+
+def generate(generator, difficulty):
+    """Division for P2 level"""
+    (d_min, d_max), (q_min, q_max) = RANGES[difficulty]
+    return build_problem(generator.rng.randint(d_min, d_max), generator.rng.randint(q_min, q_max))
+
+
+def build_problem(divisor, quotient):
+    dividend = divisor * quotient  # Ensure clean division
+
+    problem = f"{dividend} ÷ {divisor}"
+    answer = quotient
+    steps = [
+        f"We need to divide {dividend} by {divisor}",
+        f"How many times does {divisor} go into {dividend}?",
+        f"We can think: {divisor} × ? = {dividend}",
+        f"Since {divisor} × {quotient} = {dividend}",
+        f"Result: {dividend} ÷ {divisor} = {quotient}"
+    ]
+
+    return {
+        'topic': 'Division',
+        'problem': problem,
+        'answer': answer,
+        'steps': steps,
+        'message': f"➗ Division Problem:\n{problem} = ?"
+    }
+
+
+def enumerate_params(difficulty):
+    """build_problem arguments of every division fact at one difficulty, row by row"""
+    (d_min, d_max), (q_min, q_max) = RANGES[difficulty]
+    return [(d, q) for d in range(d_min, d_max + 1) for q in range(q_min, q_max + 1)]
@@ -0,0 +1,67 @@
+"""Geometric Shapes
+
+Naming shapes and counting their sides, corners and right angles.
+"""
+
+SHAPES = ['square', 'rectangle', 'triangle', 'circle']
+GEOMETRY_TYPES = ['identify', 'properties', 'count_sides']
+# Answers multiple choice picks from when the answer is a shape
+OPTIONS = SHAPES
+
+
+def generate(generator, difficulty):
+    """Identifying and drawing geometric shapes"""
+    rng = generator.rng
+    shape = rng.choice(SHAPES)
+    problem_type = rng.choice(GEOMETRY_TYPES)
+    return build_problem(shape, problem_type)
+
+
+def build_problem(shape, problem_type):
+    if problem_type == 'identify':
+        descriptions = {
+            'square': 'has 4 equal sides and 4 right angles',
+            'rectangle': 'has 4 sides with opposite sides equal and 4 right angles',
+            'triangle': 'has 3 sides and 3 angles',
+            'circle': 'is round with no corners'
+        }
+        problem = f"What shape {descriptions[shape]}?"
+        answer = shape
+
+    elif problem_type == 'properties':
+        if shape == 'square':
+            problem = f"How many sides does a square have?"
+            answer = "4"
+        elif shape == 'rectangle':
+            problem = f"How many right angles does a rectangle have?"
+            answer = "4"
+        elif shape == 'triangle':
+            problem = f"How many sides does a triangle have?"
+            answer = "3"
+        else:  # circle
+            problem = f"How many corners does a circle have?"
+            answer = "0"
+
+    else:  # count_sides
+        sides = {'square': 4, 'rectangle': 4, 'triangle': 3, 'circle': 0}
+        problem = f"How many sides does a {shape} have?"
+        answer = str(sides[shape])
+
+    steps = [
+        f"Let's think about the properties of a {shape}",
+        f"A {shape} is a geometric shape with specific characteristics",
+        f"The answer is: {answer}"
+    ]
+
+    return {
+        'topic': 'Geometric Shapes',
+        'problem': problem,
+        'answer': answer,
+        'steps': steps,
+        'message': f"🔺 Geometry Problem:\n{problem}"
+    }
+
+
+def enumerate_params():
+    """build_problem arguments of every problem of this topic, in a fixed order"""
+    return [(shape, problem_type) for shape in SHAPES for problem_type in GEOMETRY_TYPES]
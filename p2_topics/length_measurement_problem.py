@@ -0,0 +1,99 @@
+"""Measuring Lengths
+
+Choosing units, estimating and comparing lengths in cm, m and km.
+"""
+
+import re
+
+# Answers multiple choice picks from for the unit questions
+OPTIONS = ['cm', 'm', 'km']
+
+
+def generate(generator, difficulty):
+    """Measuring lengths - metric system"""
+    rng = generator.rng
+    measurement_types = ['measuring', 'estimation', 'comparison']
+    problem_type = rng.choice(measurement_types)
+
+    if problem_type == 'measuring':
+        objects = ['pencil', 'book', 'desk', 'classroom', 'playground', 'road between two towns']
+        obj = rng.choice(objects)
+        if obj in ['pencil', 'book', 'desk']:
+            unit = 'cm'
+        elif obj in ['classroom', 'playground']:
+            unit = 'm'
+        else:
+            unit = 'km'
+
+        problem = f"What is the most appropriate unit to measure a {obj}? (cm, m, or km)"
+        answer = unit
+        steps = [
+            f"We need to choose the best unit for measuring a {obj}",
+            f"Centimeters (cm) for small objects",
+            f"Meters (m) for medium objects",
+            f"Kilometers (km) for long distances",
+            f"Best unit for {obj}: {unit}"
+        ]
+    elif problem_type == 'estimation':
+        estimates = [
+            ('pencil', 12, 20, 'cm'),
+            ('exercise book', 20, 30, 'cm'),
+            ('classroom door', 2, 3, 'm'),
+            ('classroom', 6, 12, 'm'),
+            ('football pitch', 90, 110, 'm'),
+            ('walk from Kigali to Muhanga', 40, 50, 'km')
+        ]
+        obj, low, high, unit = rng.choice(estimates)
+        value = rng.randint(low, high)
+        problem = f"About how long is a {obj}? ({value} cm, {value} m or {value} km)"
+        answer = f"{value} {unit}"
+        steps = [
+            f"Think about the size of a {obj}",
+            "Centimeters (cm) for small objects",
+            "Meters (m) for rooms and fields",
+            "Kilometers (km) for journeys between towns",
+            f"Answer: {answer}"
+        ]
+    else:
+        length1 = rng.randint(10, 100)
+        length2 = rng.randint(10, 100)
+        while length1 == length2:
+            length2 = rng.randint(10, 100)
+        problem = f"Which is longer: {length1} cm or {length2} cm?"
+        answer = f"{max(length1, length2)} cm"
+        steps = [
+            f"Compare {length1} cm and {length2} cm",
+            f"The larger number represents the longer length",
+            f"Answer: {max(length1, length2)} cm is longer"
+        ]
+
+    return {
+        'topic': 'Length Measurement',
+        'problem': problem,
+        'answer': answer,
+        'steps': steps,
+        'message': f"📏 Length Measurement Problem:\n{problem}",
+        'problem_type': problem_type
+    }
+
+
+def check(user_answer, answer):
+    """Accept a length with or without a space before the unit, like "8m" for "8 m\""""
+    return normalise(user_answer) == normalise(answer)
+
+
+def normalise(text):
+    return ' '.join(re.findall(r'\d+|[^\d\s]+', text.lower()))
+
+
+def distractors(problems):
+    """The other length for "which is longer", the other units for estimates"""
+    wrong = []
+    for problem in problems:
+        choices = []
+        if re.fullmatch(r'\d+ (cm|m|km)', problem['answer']):
+            choices += [f"{number} cm" for number in re.findall(r'\d+', problem['problem'])]
+            value = problem['answer'].split()[0]
+            choices += [f"{value} {unit}" for unit in OPTIONS]
+        wrong.append(choices)
+    return wrong
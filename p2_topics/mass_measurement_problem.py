@@ -0,0 +1,44 @@
+"""Measuring Mass
+
+Choosing between grams and kilograms for everyday objects.
+"""
+
+MASS_OBJECTS = ['coin', 'apple', 'book', 'person', 'car', 'feather']
+# Answers multiple choice picks from
+OPTIONS = ['g', 'kg']
+
+
+def generate(generator, difficulty):
+    """Measuring mass - metric system"""
+    rng = generator.rng
+    obj = rng.choice(MASS_OBJECTS)
+    return build_problem(obj)
+
+
+def build_problem(obj):
+    if obj in ['coin', 'feather', 'apple', 'book']:
+        unit = 'g'
+    else:
+        unit = 'kg'
+
+    problem = f"What is the most appropriate unit to measure the mass of a {obj}? (g or kg)"
+    answer = unit
+    steps = [
+        f"We need to choose the best unit for measuring a {obj}'s mass",
+        f"Grams (g) for light objects",
+        f"Kilograms (kg) for heavy objects",
+        f"Best unit for {obj}: {unit}"
+    ]
+
+    return {
+        'topic': 'Mass Measurement',
+        'problem': problem,
+        'answer': answer,
+        'steps': steps,
+        'message': f"⚖️ Mass Measurement Problem:\n{problem}"
+    }
+
+
+def enumerate_params():
+    """build_problem arguments of every problem of this topic, in a fixed order"""
+    return [(obj,) for obj in MASS_OBJECTS]
@@ -0,0 +1,86 @@
+"""Money (Rwf)
+
+Counting Rwandan coins and working out change. This is also an example of
+a topic module: see TopicRegistry in P2.py for what a module must provide.
+"""
+
+import re
+
+NAMES = ['Keza', 'Mugisha', 'Uwase', 'Ishimwe', 'Ganza', 'Teta']
+
+# Coins pupils count with, and how many of each, per difficulty
+COINS = {
+    'Easy': [10, 20, 50],
+    'Medium': [10, 20, 50, 100],
+    'Hard': [20, 50, 100]
+}
+MAX_COINS = {'Easy': 3, 'Medium': 4, 'Hard': 5}
+
+# (item with its article, lowest price, highest price) in Rwf
+ITEMS = [
+    ('a pencil', 50, 150),
+    ('a mango', 50, 200),
+    ('an exercise book', 100, 300),
+    ('a bottle of milk', 200, 450)
+]
+PAYMENTS = [100, 200, 500]
+
+
+def generate(generator, difficulty):
+    rng = generator.rng
+    name = rng.choice(NAMES)
+
+    problem_type = rng.choice(['count', 'change'])
+    if problem_type == 'count':
+        first, second = rng.sample(COINS[difficulty], 2)
+        first_count = rng.randint(1, MAX_COINS[difficulty])
+        second_count = rng.randint(1, MAX_COINS[difficulty])
+        first_total, second_total = first * first_count, second * second_count
+        answer = first_total + second_total
+        problem = (f"{name} has {first_count} coins of {first} Rwf and {second_count} coins of "
+                   f"{second} Rwf. How much money is that?")
+        steps = [
+            f"{first_count} coins of {first} Rwf = {first_count} × {first} = {first_total} Rwf",
+            f"{second_count} coins of {second} Rwf = {second_count} × {second} = {second_total} Rwf",
+            f"Total = {first_total} + {second_total} = {answer} Rwf"
+        ]
+    else:
+        item, low, high = rng.choice(ITEMS)
+        price = rng.randrange(low, high + 1, 10)
+        paid = min(payment for payment in PAYMENTS if payment > price)
+        answer = paid - price
+        problem = f"{item.capitalize()} costs {price} Rwf. {name} pays with {paid} Rwf. How much change does {name} get?"
+        steps = [
+            f"{name} pays {paid} Rwf for something that costs {price} Rwf",
+            "Change = money paid - price",
+            f"Change = {paid} - {price} = {answer} Rwf"
+        ]
+
+    return {
+        'topic': 'Money',
+        'problem': problem,
+        'answer': str(answer),
+        'steps': steps,
+        'message': f"💰 Money Problem:\n{problem}",
+        'problem_type': problem_type
+    }
+
+
+def check(user_answer, answer):
+    """Accept the amount with or without "Rwf\""""
+    return user_answer.lower().replace('rwf', '').strip() == answer
+
+
+def distractors(problems):
+    """Likely wrong answers: one kind of coin only, or the price instead of the change"""
+    wrong = []
+    for problem in problems:
+        numbers = [int(number) for number in re.findall(r'\d+', problem['problem'])]
+        if problem.get('problem_type') == 'count':
+            first_count, first, second_count, second = numbers
+            wrong.append([first_count * first, second_count * second, first + second])
+        elif problem.get('problem_type') == 'change':
+            wrong.append([numbers[0]])
+        else:
+            wrong.append([])
+    return wrong
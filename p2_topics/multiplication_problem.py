@@ -0,0 +1,46 @@
+"""Multiplication
+
+Multiplication facts over operand ranges that grow with the difficulty.
+"""
+
+# Operand ranges per difficulty: (first operand, second operand)
+RANGES = {
+    'Easy': ((1, 5), (1, 10)),
+    'Medium': ((2, 10), (2, 12)),
+    'Hard': ((5, 15), (2, 20))
+}
+# The facts on offer change with the difficulty
+SPACE_BY_DIFFICULTY = True
+# Pupils' accuracy is counted per fact for the teacher's report
+FACTS = True
+
+
+def generate(generator, difficulty):
+    """Multiplication for P2 level"""
+    (a_min, a_max), (b_min, b_max) = RANGES[difficulty]
+    return build_problem(generator.rng.randint(a_min, a_max), generator.rng.randint(b_min, b_max))
+
+
+def build_problem(a, b):
+    problem = f"{a} × {b}"
+    answer = a * b
+    steps = [
+        f"We need to multiply {a} × {b}",
+        f"This means adding {a} exactly {b} times",
+        f"Or we can use the multiplication table",
+        f"{a} × {b} = {a * b}"
+    ]
+
+    return {
+        'topic': 'Multiplication',
+        'problem': problem,
+        'answer': answer,
+        'steps': steps,
+        'message': f"✖️ Multiplication Problem:\n{problem} = ?"
+    }
+
+
+def enumerate_params(difficulty):
+    """build_problem arguments of every multiplication fact at one difficulty, row by row"""
+    (a_min, a_max), (b_min, b_max) = RANGES[difficulty]
+    return [(a, b) for a in range(a_min, a_max + 1) for b in range(b_min, b_max + 1)]
@@ -0,0 +1,109 @@
+"""Numbers 0-999
+
+Writing numbers in digits and words, counting on and place value. Only
+the place value questions are few enough to enumerate.
+"""
+
+import re
+
+PLACES = ['hundreds', 'tens', 'ones']
+
+# Only place value questions are enumerated, so they form their own space
+SPACE = 'place_value'
+
+
+def generate(generator, difficulty):
+    """Numbers 0-999: counting, reading, writing"""
+    rng = generator.rng
+    problem_types = ['write_number', 'read_number', 'count_sequence', 'place_value']
+    problem_type = rng.choice(problem_types)
+
+    if problem_type == 'write_number':
+        num = rng.randint(1, 999)
+        number_words = generator.number_to_words(num)
+        problem = f"Write this number in digits: {number_words}"
+        answer = str(num)
+        steps = [
+            f"We need to write '{number_words}' in digits",
+            f"Let's break down the number word by word",
+            f"The answer is: {num}"
+        ]
+    elif problem_type == 'read_number':
+        num = rng.randint(1, 999)
+        problem = f"Write this number in words: {num}"
+        answer = generator.number_to_words(num).lower()
+        steps = [
+            f"We need to write {num} in words",
+            f"Let's break it down by place value",
+            f"The answer is: {generator.number_to_words(num)}"
+        ]
+    elif problem_type == 'count_sequence':
+        start = rng.randint(1, 980)
+        problem = f"Continue this counting pattern: {start}, {start+1}, {start+2}, ?, {start+4}"
+        answer = str(start + 3)
+        steps = [
+            f"Look at the pattern: {start}, {start+1}, {start+2}, ?, {start+4}",
+            f"Each number increases by 1",
+            f"The missing number is: {start + 3}"
+        ]
+    else:  # place_value
+        num = rng.randint(100, 999)
+        place = rng.choice(PLACES)
+        return build_problem(num, place)
+
+    return {
+        'topic': 'Numeration 0-999',
+        'problem': problem,
+        'answer': answer,
+        'steps': steps,
+        'message': f"📊 Numeration Problem (0-999):\n{problem}",
+        'problem_type': problem_type
+    }
+
+
+def build_problem(num, place):
+    """The place value question for one digit of a number"""
+    if place == 'hundreds':
+        answer = num // 100
+    elif place == 'tens':
+        answer = (num // 10) % 10
+    else:
+        answer = num % 10
+
+    problem = f"What digit is in the {place} place in the number {num}?"
+    answer = str(answer)
+    steps = [
+        f"In the number {num}:",
+        f"Hundreds place: {num // 100}",
+        f"Tens place: {(num // 10) % 10}",
+        f"Ones place: {num % 10}",
+        f"The digit in the {place} place is: {answer}"
+    ]
+
+    return {
+        'topic': 'Numeration 0-999',
+        'problem': problem,
+        'answer': answer,
+        'steps': steps,
+        'message': f"📊 Numeration Problem (0-999):\n{problem}",
+        'problem_type': 'place_value'
+    }
+
+
+def enumerate_params():
+    """build_problem arguments of every place value question, in a fixed order"""
+    return [(num, place) for num in range(100, 1000) for place in PLACES]
+
+
+def distractors(problems):
+    """Off-by-one counting, and digits read from another place"""
+    wrong = []
+    for problem in problems:
+        if problem.get('problem_type') == 'count_sequence':
+            answer = int(problem['answer'])
+            wrong.append([answer - 1, answer + 1])
+        elif problem.get('problem_type') == 'place_value':
+            wrong.append(list(re.findall(r'\d+', problem['problem'])[0]))
+        else:
+            wrong.append([])
+    return wrong
@@ -0,0 +1,53 @@
+"""Perimeter
+
+Perimeters of squares, rectangles and triangles in centimetres.
+"""
+
+
+def generate(generator, difficulty):
+    """Calculating perimeter of geometric figures"""
+    rng = generator.rng
+    shapes = ['square', 'rectangle', 'triangle']
+    shape = rng.choice(shapes)
+
+    if shape == 'square':
+        side = rng.randint(3, 15)
+        problem = f"Find the perimeter of a square with side length {side} cm"
+        answer = str(4 * side)
+        steps = [
+            f"A square has 4 equal sides of length {side} cm",
+            f"Perimeter = side + side + side + side",
+            f"Perimeter = 4 × {side} = {4 * side} cm"
+        ]
+
+    elif shape == 'rectangle':
+        length = rng.randint(5, 20)
+        width = rng.randint(3, length-1)
+        problem = f"Find the perimeter of a rectangle with length {length} cm and width {width} cm"
+        answer = str(2 * (length + width))
+        steps = [
+            f"A rectangle has length {length} cm and width {width} cm",
+            f"Perimeter = length + width + length + width",
+            f"Perimeter = 2 × (length + width)",
+            f"Perimeter = 2 × ({length} + {width}) = 2 × {length + width} = {2 * (length + width)} cm"
+        ]
+
+    else:  # triangle
+        side1 = rng.randint(3, 12)
+        side2 = rng.randint(3, 12)
+        side3 = rng.randint(3, 12)
+        problem = f"Find the perimeter of a triangle with sides {side1} cm, {side2} cm, and {side3} cm"
+        answer = str(side1 + side2 + side3)
+        steps = [
+            f"A triangle has three sides: {side1} cm, {side2} cm, and {side3} cm",
+            f"Perimeter = side1 + side2 + side3",
+            f"Perimeter = {side1} + {side2} + {side3} = {side1 + side2 + side3} cm"
+        ]
+
+    return {
+        'topic': 'Perimeter',
+        'problem': problem,
+        'answer': answer,
+        'steps': steps,
+        'message': f"📐 Perimeter Problem:\n{problem}"
+    }
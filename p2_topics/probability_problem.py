@@ -0,0 +1,89 @@
+"""Probability
+
+Describing chances as certain, likely, unlikely or impossible.
+"""
+
+# Answers multiple choice picks from
+OPTIONS = ['likely', 'unlikely', 'certain', 'impossible']
+
+
+def generate(generator, difficulty):
+    """Understanding and applying probability concepts"""
+    rng = generator.rng
+    problem_types = ['basic_probability', 'certain_impossible', 'likely_unlikely']
+    problem_type = rng.choice(problem_types)
+
+    if problem_type == 'basic_probability':
+        colors = ['red', 'blue', 'green', 'yellow']
+        target_color = rng.choice(colors)
+        total_balls = rng.randint(5, 10)
+        # Exactly half is neither likely nor unlikely, so leave it out
+        target_balls = rng.choice([n for n in range(total_balls + 1) if 2 * n != total_balls])
+
+        problem = f"In a bag, there are {target_balls} {target_color} balls and {total_balls - target_balls} other colored balls. What is the chance of picking a {target_color} ball? (likely, unlikely, certain, impossible)"
+
+        if target_balls == total_balls:
+            answer = "certain"
+        elif target_balls == 0:
+            answer = "impossible"
+        elif 2 * target_balls > total_balls:
+            answer = "likely"
+        else:
+            answer = "unlikely"
+
+        steps = [
+            f"There are {target_balls} {target_color} balls out of {total_balls} total balls",
+            f"If all of them are {target_color}, it's certain",
+            f"If none of them are {target_color}, it's impossible",
+            f"If more than half are {target_color}, it's likely",
+            f"If less than half are {target_color}, it's unlikely",
+            f"Answer: {answer}"
+        ]
+
+    elif problem_type == 'certain_impossible':
+        scenarios = [
+            ("The sun will rise tomorrow", "certain"),
+            ("You will grow wings and fly", "impossible"),
+            ("It will rain sometime this year", "likely"),
+            ("It will snow in Kigali tomorrow", "unlikely"),
+            ("You will meet a dinosaur today", "impossible"),
+            ("You will breathe air today", "certain")
+        ]
+        scenario, answer = rng.choice(scenarios)
+        problem = f"Is this certain, impossible, likely, or unlikely: '{scenario}'?"
+        answer = answer
+        steps = [
+            f"Let's think about: {scenario}",
+            f"Certain = will definitely happen",
+            f"Impossible = will never happen",
+            f"Likely = probably will happen",
+            f"Unlikely = probably won't happen",
+            f"Answer: {answer}"
+        ]
+
+    else:  # likely_unlikely
+        activities = [
+            ("It will rain in the desert", "unlikely"),
+            ("A coin will land on heads or tails", "certain"),
+            ("You will eat food today", "likely"),
+            ("You will win the lottery", "unlikely"),
+            ("A goat will read a book to you", "impossible"),
+            ("The sun will set tonight", "certain")
+        ]
+        activity, answer = rng.choice(activities)
+        problem = f"Is this likely, unlikely, certain, or impossible: '{activity}'?"
+        answer = answer
+        steps = [
+            f"Let's analyze: {activity}",
+            f"Think about how often this happens",
+            f"Answer: {answer}"
+        ]
+
+    return {
+        'topic': 'Probability',
+        'problem': problem,
+        'answer': answer,
+        'steps': steps,
+        'message': f"🎲 Probability Problem:\n{problem}",
+        'problem_type': problem_type
+    }
@@ -0,0 +1,49 @@
+"""Subtraction (up to 999)
+
+Column subtraction with borrowing, from numbers up to 999.
+"""
+
+from p2_topics._columns import ColumnSolver
+
+
+def generate(generator, difficulty):
+    """Subtraction up to 999"""
+    return generate_batch(generator, difficulty, 1)[0]
+
+
+def generate_batch(generator, difficulty, count):
+    """Several subtractions, with all their columns worked in one ColumnSolver pass"""
+    rng = generator.rng
+    min_val, max_val = generator.get_p2_number_range(difficulty)
+    pairs = []
+    for _ in range(count):
+        a = rng.randint(min_val, max_val)
+        b = rng.randint(min_val, a)  # Ensure positive result
+        pairs.append((a, b))
+    return [build_problem(a, b, steps) for (a, b), steps in zip(pairs, ColumnSolver.subtraction_steps(pairs))]
+
+
+def build_problem(a, b, steps):
+    problem = f"{a} - {b}"
+    answer = a - b
+
+    return {
+        'topic': 'Subtraction up to 999',
+        'problem': problem,
+        'answer': answer,
+        'steps': steps,
+        'message': f"➖ Subtraction Problem (up to 999):\n{problem} = ?",
+        'operands': (a, b)
+    }
+
+
+def distractors(problems):
+    """The smaller digit taken from the larger in every column, for the whole list at once"""
+    wrong = iter(reversed_subtraction([problem['operands'] for problem in problems if 'operands' in problem]))
+    return [[next(wrong)] if 'operands' in problem else [] for problem in problems]
+
+
+def reversed_subtraction(pairs):
+    """Smaller digit taken from larger in every column, for (a, b) pairs"""
+    return [sum(abs((a // place) % 10 - (b // place) % 10) * place for place in (1, 10, 100))
+            for a, b in pairs]
@@ -0,0 +1,102 @@
+"""Unit Conversion
+
+Converting between metres and centimetres, litres and millilitres,
+and kilograms and grams.
+"""
+
+# Answers go past 999, since 1 l = 1000 ml and so on
+ANSWER_LIMIT = 5000
+
+
+def generate(generator, difficulty):
+    """Converting between units of measurement"""
+    rng = generator.rng
+    conversion_types = ['length', 'capacity', 'mass']
+    conv_type = rng.choice(conversion_types)
+
+    if conv_type == 'length':
+        if rng.choice([True, False]):
+            meters = rng.randint(1, 10)
+            problem = f"Convert {meters} meters to centimeters"
+            answer = str(meters * 100)
+            steps = [
+                f"We need to convert {meters} meters to centimeters",
+                f"1 meter = 100 centimeters",
+                f"{meters} meters = {meters} × 100 = {meters * 100} centimeters"
+            ]
+        else:
+            cm = rng.randint(100, 1000)
+            if cm % 100 == 0:  # Only use values that convert evenly
+                problem = f"Convert {cm} centimeters to meters"
+                answer = str(cm // 100)
+                steps = [
+                    f"We need to convert {cm} centimeters to meters",
+                    f"100 centimeters = 1 meter",
+                    f"{cm} centimeters = {cm} ÷ 100 = {cm // 100} meters"
+                ]
+            else:
+                cm = 500  # Use a simple conversion
+                problem = f"Convert {cm} centimeters to meters"
+                answer = str(cm // 100)
+                steps = [
+                    f"We need to convert {cm} centimeters to meters",
+                    f"100 centimeters = 1 meter",
+                    f"{cm} centimeters = {cm} ÷ 100 = {cm // 100} meters"
+                ]
+
+    elif conv_type == 'capacity':
+        if rng.choice([True, False]):
+            liters = rng.randint(1, 5)
+            problem = f"Convert {liters} liters to milliliters"
+            answer = str(liters * 1000)
+            steps = [
+                f"We need to convert {liters} liters to milliliters",
+                f"1 liter = 1000 milliliters",
+                f"{liters} liters = {liters} × 1000 = {liters * 1000} milliliters"
+            ]
+        else:
+            ml = rng.choice([1000, 2000, 3000, 4000, 5000])
+            problem = f"Convert {ml} milliliters to liters"
+            answer = str(ml // 1000)
+            steps = [
+                f"We need to convert {ml} milliliters to liters",
+                f"1000 milliliters = 1 liter",
+                f"{ml} milliliters = {ml} ÷ 1000 = {ml // 1000} liters"
+            ]
+
+    else:  # mass
+        if rng.choice([True, False]):
+            kg = rng.randint(1, 5)
+            problem = f"Convert {kg} kilograms to grams"
+            answer = str(kg * 1000)
+            steps = [
+                f"We need to convert {kg} kilograms to grams",
+                f"1 kilogram = 1000 grams",
+                f"{kg} kilograms = {kg} × 1000 = {kg * 1000} grams"
+            ]
+        else:
+            g = rng.choice([1000, 2000, 3000, 4000, 5000])
+            problem = f"Convert {g} grams to kilograms"
+            answer = str(g // 1000)
+            steps = [
+                f"We need to convert {g} grams to kilograms",
+                f"1000 grams = 1 kilogram",
+                f"{g} grams = {g} ÷ 1000 = {g // 1000} kilograms"
+            ]
+
+    return {
+        'topic': 'Unit Conversion',
+        'problem': problem,
+        'answer': answer,
+        'steps': steps,
+        'message': f"🔄 Unit Conversion Problem:\n{problem}"
+    }
+
+
+def distractors(problems):
+    """Multiplying or dividing by 10 instead of 100, or 100 instead of 1000"""
+    wrong = []
+    for problem in problems:
+        answer = int(problem['answer'])
+        wrong.append([answer * 10, answer // 10 if answer % 10 == 0 else answer * 100])
+    return wrong
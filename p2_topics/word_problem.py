@@ -0,0 +1,116 @@
+"""Word Problems
+
+Shopping, measurement, classroom and garden stories that use the other
+P2 topics.
+"""
+
+
+def generate(generator, difficulty):
+    """Word problems incorporating P2 curriculum topics"""
+    rng = generator.rng
+    problem_categories = ['shopping', 'measurement', 'school', 'geometry']
+    category = rng.choice(problem_categories)
+
+    if category == 'shopping':
+        item1 = rng.choice(['apples', 'bananas', 'oranges', 'mangoes'])
+        item2 = rng.choice(['notebooks', 'pencils', 'erasers', 'rulers'])
+        price1 = rng.randint(100, 800)  # Rwanda Francs
+        price2 = rng.randint(50, min(500, 999 - price1))  # Keep totals ≤ 999
+
+        operation = rng.choice(['addition', 'subtraction'])
+        if operation == 'addition':
+            problem = f"Marie bought {item1} for {price1} Rwf and {item2} for {price2} Rwf. How much did she spend in total?"
+            answer = str(price1 + price2)
+            steps = [
+                f"Marie spent {price1} Rwf on {item1}",
+                f"She spent {price2} Rwf on {item2}",
+                f"Total = {price1} + {price2} = {price1 + price2} Rwf"
+            ]
+        else:
+            if price1 > price2:
+                problem = f"Jean had {price1} Rwf. He bought something for {price2} Rwf. How much money does he have left?"
+                answer = str(price1 - price2)
+                steps = [
+                    f"Jean started with {price1} Rwf",
+                    f"He spent {price2} Rwf",
+                    f"Money left = {price1} - {price2} = {price1 - price2} Rwf"
+                ]
+            else:
+                # Swap to ensure positive result
+                problem = f"Jean had {price2} Rwf. He bought something for {price1} Rwf. How much money does he have left?"
+                answer = str(price2 - price1)
+                steps = [
+                    f"Jean started with {price2} Rwf",
+                    f"He spent {price1} Rwf",
+                    f"Money left = {price2} - {price1} = {price2 - price1} Rwf"
+                ]
+
+    elif category == 'measurement':
+        measurements = [
+            ('height', 'meters', rng.randint(1, 3)),
+            ('length', 'centimeters', rng.randint(20, 200)),
+            ('mass', 'kilograms', rng.randint(5, 50)),
+            ('capacity', 'liters', rng.randint(2, 20))
+        ]
+        measure_type, unit, value1 = rng.choice(measurements)
+        value2 = rng.randint(1, value1)
+
+        problem = f"A rope is {value1} {unit} long. If we cut off {value2} {unit}, how long is the remaining rope?"
+        answer = str(value1 - value2)
+        steps = [
+            f"Original rope length: {value1} {unit}",
+            f"Length cut off: {value2} {unit}",
+            f"Remaining length = {value1} - {value2} = {value1 - value2} {unit}"
+        ]
+
+    elif category == 'school':
+        students = rng.randint(20, 40)
+        groups = rng.randint(2, 8)
+        if students % groups == 0:  # Ensure even division
+            problem = f"There are {students} students in Primary 2. The teacher wants to divide them into {groups} equal groups. How many students will be in each group?"
+            answer = str(students // groups)
+            steps = [
+                f"Total students: {students}",
+                f"Number of groups: {groups}",
+                f"Students per group = {students} ÷ {groups} = {students // groups}"
+            ]
+        else:
+            # Adjust to make it work
+            students = groups * rng.randint(3, 8)
+            problem = f"There are {students} students in Primary 2. The teacher wants to divide them into {groups} equal groups. How many students will be in each group?"
+            answer = str(students // groups)
+            steps = [
+                f"Total students: {students}",
+                f"Number of groups: {groups}",
+                f"Students per group = {students} ÷ {groups} = {students // groups}"
+            ]
+
+    else:  # geometry
+        shape = rng.choice(['square', 'rectangle'])
+        if shape == 'square':
+            side = rng.randint(4, 12)
+            problem = f"A square garden has sides of {side} meters each. What is the perimeter of the garden?"
+            answer = str(4 * side)
+            steps = [
+                f"Square garden with side = {side} meters",
+                f"Perimeter of square = 4 × side",
+                f"Perimeter = 4 × {side} = {4 * side} meters"
+            ]
+        else:
+            length = rng.randint(8, 20)
+            width = rng.randint(4, length-1)
+            problem = f"A rectangular field is {length} meters long and {width} meters wide. What is the perimeter of the field?"
+            answer = str(2 * (length + width))
+            steps = [
+                f"Rectangular field: length = {length}m, width = {width}m",
+                f"Perimeter = 2 × (length + width)",
+                f"Perimeter = 2 × ({length} + {width}) = {2 * (length + width)} meters"
+            ]
+
+    return {
+        'topic': 'Word Problems',
+        'problem': problem,
+        'answer': answer,
+        'steps': steps,
+        'message': f"📚 Word Problem:\n{problem}"
+    }
@@ -0,0 +1,142 @@
+"""Sync round trips against a local stand-in hub and over a USB delta file"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from P2 import SyncHub, SyncReplica
+
+
+def log_attempts(path, student, attempts):
+    """Append (topic, correct) attempts to a machine's attempt log"""
+    with open(path, 'a') as f:
+        for topic, correct in attempts:
+            f.write(json.dumps({'student': student, 'class': 'P2', 'kind': 'addition_problem',
+                                'topic': topic, 'difficulty': 'Easy', 'correct': correct,
+                                'hints': 0, 'timestamp': '2026-10-19T09:00:00'}) + "\n")
+
+
+class SyncTestCase(unittest.TestCase):
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.directory = os.path.join(temp.name, 'school')
+
+    def replica(self, name, role='machine'):
+        directory = os.path.join(self.directory, name)
+        own_log = None if role == 'hub' else os.path.join(directory, 'attempts.jsonl')
+        return SyncReplica(directory, own_log=own_log, role=role)
+
+    def own_log(self, replica):
+        os.makedirs(os.path.dirname(replica.own_log), exist_ok=True)
+        return replica.own_log
+
+
+class HubRoundTripTest(SyncTestCase):
+    def setUp(self):
+        super().setUp()
+        self.hub = SyncHub(self.replica('hub', role='hub'), ('127.0.0.1', 0))
+        self.port = self.hub.server_address[1]
+        threading.Thread(target=self.hub.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.hub.shutdown()
+        self.hub.server_close()
+
+    def test_two_machines_meet_through_the_hub(self):
+        first, second = self.replica('first'), self.replica('second')
+        log_attempts(self.own_log(first), 'Ana', [('Addition', True), ('Division', False)])
+        log_attempts(self.own_log(second), 'Ana', [('Perimeter', True)])
+        log_attempts(self.own_log(second), 'Bob', [('Addition', True)])
+
+        hub_id = first.sync_with_hub('127.0.0.1', self.port)
+        self.assertEqual(second.sync_with_hub('127.0.0.1', self.port), hub_id)
+        first.sync_with_hub('127.0.0.1', self.port)
+
+        for replica in (first, second, self.hub.replica):
+            self.assertEqual(replica.student_progress('Ana'), {
+                'problems_solved': 3, 'correct_answers': 2,
+                'topics_practiced': {'Addition', 'Division', 'Perimeter'}})
+            self.assertEqual(replica.student_progress('Bob')['problems_solved'], 1)
+        self.assertEqual(first.version(), second.version())
+
+    def test_sync_sends_only_new_attempts(self):
+        machine = self.replica('machine')
+        log_attempts(self.own_log(machine), 'Ana', [('Addition', True)])
+        machine.sync_with_hub('127.0.0.1', self.port)
+        self.assertEqual(machine.delta_since(machine.state['peers'][machine.state['hub_id']]), {})
+
+        log_attempts(self.own_log(machine), 'Ana', [('Division', True)])
+        delta = machine.delta_since(machine.state['peers'][machine.state['hub_id']])
+        self.assertEqual(delta[machine.machine_id][1].count("\n"), 1)
+
+        machine.sync_with_hub('127.0.0.1', self.port)
+        self.assertEqual(self.hub.replica.student_progress('Ana')['problems_solved'], 2)
+
+
+class UsbRoundTripTest(SyncTestCase):
+    def test_delta_files_carry_attempts_both_ways(self):
+        hub, first, second = self.replica('hub', role='hub'), self.replica('first'), self.replica('second')
+        log_attempts(self.own_log(first), 'Ana', [('Addition', True)])
+        log_attempts(self.own_log(second), 'Ana', [('Division', True), ('Division', False)])
+        stick = os.path.join(self.directory, 'stick.delta')
+
+        # Each machine's stick goes to the hub, which answers on the same stick
+        for machine in (first, second):
+            machine.export_delta(stick)
+            peer = hub.import_delta(stick)
+            self.assertEqual(peer, machine.machine_id)
+            hub.export_delta(stick, peer)
+            self.assertEqual(machine.import_delta(stick), hub.machine_id)
+        first.export_delta(stick)
+        hub.import_delta(stick)
+        hub.export_delta(stick, first.machine_id)
+        first.import_delta(stick)
+
+        for replica in (hub, first, second):
+            self.assertEqual(replica.student_progress('Ana')['problems_solved'], 3)
+        self.assertEqual(first.version(), hub.version())
+
+        # Importing the same stick again changes nothing
+        first.import_delta(stick)
+        self.assertEqual(first.student_progress('Ana')['problems_solved'], 3)
+
+
+class BadDeltaTest(SyncTestCase):
+    def test_machine_ids_cannot_name_other_files(self):
+        hub = self.replica('hub', role='hub')
+        line = json.dumps({'student': 'Ana', 'topic': 'Addition', 'correct': True}) + "\n"
+        with self.assertRaises(ValueError):
+            hub.apply_delta({'../../escaped': [0, line]})
+        # hub/../../escaped.jsonl would land next to the school directory
+        self.assertFalse(os.path.exists(os.path.join(os.path.dirname(self.directory), 'escaped.jsonl')))
+
+    def test_malformed_attempts_are_not_written(self):
+        hub = self.replica('hub', role='hub')
+        machine = 'a' * 12
+        good = json.dumps({'student': 'Ana', 'topic': 'Addition', 'correct': True}) + "\n"
+        with self.assertRaises(ValueError):
+            hub.apply_delta({machine: [0, good + json.dumps({'student': 'Ana'}) + "\n"]})
+        self.assertFalse(os.path.exists(hub.log_path(machine)))
+        self.assertEqual(hub.version(), {})
+
+        hub.apply_delta({machine: [0, good]})
+        self.assertEqual(hub.version(), {machine: len(good)})
+        self.assertEqual(os.path.getsize(hub.log_path(machine)), len(good))
+
+    def test_oversized_frames_are_refused(self):
+        class Stream:
+            def read(self, size):
+                return b'\xff\xff\xff\xff'
+
+        with self.assertRaises(ValueError):
+            SyncReplica.read_frame(Stream())
+
+
+if __name__ == '__main__':
+    unittest.main()